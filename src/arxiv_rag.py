@@ -6,6 +6,7 @@ Design goals:
 - Works with existing project deps (stdlib + requests already in repo)
 - Uses SQLite FTS5 BM25 for keyword retrieval (always available on most Python builds)
 - Optionally adds semantic retrieval using OpenRouter embeddings (cached in SQLite)
+- Vectorizes semantic scoring with NumPy (and SimSIMD) when installed; pure Python otherwise
 
 Typical usage (from PostWorkflow):
     rag = ArxivAbstractRAG(project_root=PROJECT_ROOT, openrouter_api_key=OPENROUTER_API_KEY)
@@ -16,6 +17,8 @@ Typical usage (from PostWorkflow):
 from __future__ import annotations
 
 import hashlib
+import heapq
+import io
 import json
 import math
 import os
@@ -23,18 +26,77 @@ import re
 import sqlite3
 import struct
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:
     import requests
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover
     requests = None
+    Retry = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import simsimd
+except ImportError:  # pragma: no cover
+    simsimd = None
+
+
+# Content fingerprints are equality checks only (no cryptographic need). Pinned
+# to stdlib BLAKE2b-128 so stored hashes don't depend on which optional packages
+# are installed: a mismatch would re-chunk and re-embed (paid) unchanged files.
+def _hasher(data: bytes = b""):
+    return hashlib.blake2b(data, digest_size=16)
+
+
+_H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_H2_SPLIT_RE = re.compile(r"(?=^##\s+)", re.MULTILINE)
+_H2_TITLE_RE = re.compile(r"^##\s+(.+)$", re.MULTILINE)
+_WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+
+# HTTP statuses worth retrying (rate limit / transient upstream errors).
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Concurrent embedding batches / pooled keep-alive connections to OpenRouter.
+_HTTP_POOL_SIZE = 4
+
+# Chunk lists kept per source file in rag_chunk_cache (most recent versions).
+_CHUNK_CACHE_VERSIONS = 4
+
+# Bump when schema/indexing changes so existing corpus fingerprints stop matching.
+_INDEX_VERSION = 1
+
+# Dropped from FTS queries so BM25 is not dominated by filler words.
+_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "are", "as", "at", "be", "been", "but", "by", "can", "do",
+        "does", "for", "from", "has", "have", "how", "in", "into", "is", "it", "its",
+        "near", "not", "of", "on", "or", "our", "that", "the", "their", "them", "these",
+        "they", "this", "those", "to", "via", "was", "we", "were", "what", "when",
+        "where", "which", "who", "why", "will", "with", "you", "your",
+    }
+)
 
 
-def _sha256_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8", errors="ignore")).hexdigest()
+def _hash_text(text: str) -> str:
+    return _hasher(text.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    """Fingerprint of a file's raw bytes, streamed via hashlib.file_digest when available (3.11+)."""
+    with path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, _hasher).hexdigest()
+        h = _hasher()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        return h.hexdigest()
 
 
 def _now_s() -> int:
@@ -44,14 +106,21 @@ def _now_s() -> int:
 def _safe_fts_query(query: str) -> str:
     """
     Best-effort escape for FTS5 MATCH queries.
-    We keep it simple: tokenize into words and join with OR.
+    We keep it simple: tokenize into lowercase words, drop stopwords and
+    duplicates, and OR together prefix terms (`word*`).
     This avoids many syntax pitfalls with punctuation.
     """
-    terms = re.findall(r"[A-Za-z0-9_]+", query or "")
+    terms: List[str] = []
+    seen = set()
+    for t in _WORD_RE.findall(query or ""):
+        t = t.lower()
+        if len(t) > 1 and t not in _STOPWORDS and t not in seen:
+            seen.add(t)
+            terms.append(t)
     if not terms:
         return ""
     # OR is usually better for short keyword lists in abstracts.
-    return " OR ".join(terms[:25])
+    return " OR ".join(f"{t}*" for t in terms[:25])
 
 
 def chunk_markdown_by_h2(content: str, filename: str) -> List[Dict]:
@@ -59,16 +128,16 @@ def chunk_markdown_by_h2(content: str, filename: str) -> List[Dict]:
     Chunk markdown by '## ' headers (keeps semantic sections together).
     If no sections, returns one chunk with the whole document.
     """
-    title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+    title_match = _H1_RE.search(content)
     doc_title = title_match.group(1).strip() if title_match else filename
 
-    sections = re.split(r"(?=^##\s+)", content, flags=re.MULTILINE)
+    sections = _H2_SPLIT_RE.split(content)
     chunks: List[Dict] = []
     for section in sections:
         section = section.strip()
         if not section:
             continue
-        section_title_match = re.search(r"^##\s+(.+)$", section, re.MULTILINE)
+        section_title_match = _H2_TITLE_RE.search(section)
         section_title = (
             section_title_match.group(1).strip() if section_title_match else "Introduction"
         )
@@ -106,14 +175,65 @@ def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     return dot / (na * nb)
 
 
-def _pack_f32(vec: Sequence[float]) -> bytes:
-    return struct.pack(f"{len(vec)}f", *vec)
+def _top_k_indices(sims: "np.ndarray", k: int) -> "np.ndarray":
+    """Indices of the `k` largest entries of `sims` (unordered), O(N) via argpartition."""
+    n = int(sims.shape[0])
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= n:
+        return np.arange(n)
+    return np.argpartition(-sims, k - 1)[:k]
+
+
+# Embedding BLOB storage formats: dtype tag -> struct format char.
+_STRUCT_FORMATS = {"f32": "f", "f16": "e"}
 
 
-def _unpack_f32(blob: bytes, dim: int) -> List[float]:
+def _minmax_normalize(scores: Dict[int, float], invert: bool = False) -> Dict[int, float]:
+    """
+    Min-max scale score values to [0, 1] (1 = highest, or lowest when `invert`).
+    All-equal inputs map to 1.0. Uses one NumPy pass when available.
+    """
+    if not scores:
+        return {}
+    if np is not None:
+        vals = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+        mn, mx = vals.min(), vals.max()
+        if mn == mx:
+            return dict.fromkeys(scores, 1.0)
+        out = (mx - vals) if invert else (vals - mn)
+        out /= mx - mn
+        return dict(zip(scores.keys(), out.tolist()))
+
+    vals = list(scores.values())
+    mn = min(vals)
+    mx = max(vals)
+    if mn == mx:
+        return {k: 1.0 for k in scores}
+    rng = mx - mn
+    if invert:
+        return {k: (mx - v) / rng for k, v in scores.items()}
+    return {k: (v - mn) / rng for k, v in scores.items()}
+
+
+def _pack_embedding(vec: Sequence[float], dtype: str = "f32") -> bytes:
+    """Pack an embedding scaled to unit L2 norm, so cosine similarity is a plain dot product."""
+    if np is not None:
+        arr = np.asarray(vec, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if norm > 0.0:
+            arr = arr / norm
+        return (arr.astype(np.float16) if dtype == "f16" else arr).tobytes()
+    norm = math.sqrt(math.fsum(x * x for x in vec))
+    if norm > 0.0:
+        vec = [x / norm for x in vec]
+    return struct.pack(f"{len(vec)}{_STRUCT_FORMATS[dtype]}", *vec)
+
+
+def _unpack_embedding(blob: bytes, dim: int, dtype: str = "f32") -> List[float]:
     if not blob or dim <= 0:
         return []
-    return list(struct.unpack(f"{dim}f", blob))
+    return list(struct.unpack(f"{dim}{_STRUCT_FORMATS.get(dtype, 'f')}", blob))
 
 
 @dataclass
@@ -145,7 +265,12 @@ class ArxivAbstractRAG:
         embedding_model: str = "openai/text-embedding-3-small",
         keyword_weight: float = 0.6,
         semantic_weight: float = 0.4,
+        storage_dtype: str = "f16",
+        unsafe_fast: bool = False,
     ) -> None:
+        if storage_dtype not in _STRUCT_FORMATS:
+            raise ValueError(f"storage_dtype must be one of {sorted(_STRUCT_FORMATS)}, got {storage_dtype!r}")
+
         self.project_root = Path(project_root)
         self.docs_dir = Path(docs_dir) if docs_dir else (self.project_root / "arxiv-abstracts")
 
@@ -158,20 +283,104 @@ class ArxivAbstractRAG:
         self.embedding_model = embedding_model
         self.keyword_weight = float(keyword_weight)
         self.semantic_weight = float(semantic_weight)
+        self.storage_dtype = storage_dtype
+        # synchronous=OFF: only for throwaway build-from-scratch reindexing runs.
+        self.unsafe_fast = bool(unsafe_fast)
+
+        # (model, row_count, max_chunk_id, chunk_ids, normalized matrix)
+        self._emb_cache: Optional[Tuple[str, int, int, "np.ndarray", "np.ndarray"]] = None
+        self._sess: Optional["requests.Session"] = None
+
+        # Corpus fingerprint of the last completed index pass (see ensure_index).
+        self.fingerprint_path = self.db_path.with_name(self.db_path.name + ".fingerprint")
+        self._indexed_fingerprint: Optional[str] = None
+
+    def _session(self) -> "requests.Session":
+        """
+        Lazily created keep-alive HTTP session, shared by corpus embedding batches and
+        per-query embeddings so TCP/TLS setup is paid once. 429/5xx are retried with
+        exponential backoff by the adapter (honouring Retry-After); read failures are
+        not, so a batch that may already have been processed is never re-sent.
+        """
+        if self._sess is None:
+            sess = requests.Session()
+            sess.headers.update(
+                {
+                    "Authorization": f"Bearer {self.openrouter_api_key}",
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": "https://github.com/dailytoparxiv/post_generation",
+                    "X-Title": "Post Generation Tool",
+                }
+            )
+            retry = Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=sorted(_RETRY_STATUSES),
+                allowed_methods=frozenset({"POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE, max_retries=retry
+            )
+            sess.mount("https://", adapter)
+            self._sess = sess
+        return self._sess
 
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # WAL makes synchronous=NORMAL crash-safe; bigger page cache + mmap serve reads from memory.
+        conn.executescript(
+            f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous={'OFF' if self.unsafe_fast else 'NORMAL'};
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=3000;
+            """
+        )
         return conn
 
+    def _corpus_fingerprint(self) -> str:
+        """Hash of the sorted (name, mtime_ns, size) listing of docs_dir/*.md (stat only)."""
+        entries: List[Tuple[str, int, int]] = []
+        with os.scandir(self.docs_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file():
+                    st = entry.stat()
+                    entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        entries.sort()
+        return hashlib.sha256(repr((_INDEX_VERSION, entries)).encode("utf-8")).hexdigest()
+
+    def _index_is_current(self, fingerprint: str) -> bool:
+        if not self.db_path.exists():
+            return False
+        if self._indexed_fingerprint == fingerprint:
+            return True
+        try:
+            return self.fingerprint_path.read_text(encoding="utf-8").strip() == fingerprint
+        except OSError:
+            return False
+
     def ensure_index(self) -> None:
         """
         Ensure tables exist and docs are indexed.
-        Safe to call repeatedly.
+        Safe to call repeatedly; when the docs directory listing (names, mtimes, sizes)
+        matches the last completed pass, schema setup and indexing are skipped.
         """
         if not self.docs_dir.exists():
             return
 
+        fingerprint = self._corpus_fingerprint()
+        if self._index_is_current(fingerprint):
+            self._indexed_fingerprint = fingerprint
+            if self.enable_semantic:
+                self._ensure_embeddings_cached()
+            return
+
         with self._connect() as conn:
             cur = conn.cursor()
 
@@ -195,12 +404,26 @@ class ArxivAbstractRAG:
                 CREATE TABLE IF NOT EXISTS rag_sources (
                     source_file TEXT PRIMARY KEY,
                     file_hash TEXT NOT NULL,
-                    indexed_at INTEGER NOT NULL
+                    indexed_at INTEGER NOT NULL,
+                    mtime_ns INTEGER,
+                    size INTEGER
                 )
                 """
             )
-
-            # FTS5 index (BM25)
+            # Migrate: stat columns let unchanged files be skipped without hashing.
+            src_cols = {r["name"] for r in cur.execute("PRAGMA table_info(rag_sources)")}
+            for col in ("mtime_ns", "size"):
+                if col not in src_cols:
+                    cur.execute(f"ALTER TABLE rag_sources ADD COLUMN {col} INTEGER")
+
+            # FTS5 index (BM25), with prefix indexes for the `term*` queries.
+            # Older caches were built without them: drop and rebuild from rag_chunks.
+            fts_row = cur.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'rag_chunks_fts'"
+            ).fetchone()
+            rebuild_fts = bool(fts_row) and "prefix=" not in (fts_row["sql"] or "")
+            if rebuild_fts:
+                cur.execute("DROP TABLE rag_chunks_fts")
             cur.execute(
                 """
                 CREATE VIRTUAL TABLE IF NOT EXISTS rag_chunks_fts USING fts5(
@@ -208,10 +431,13 @@ class ArxivAbstractRAG:
                     source_file,
                     section_title,
                     content='rag_chunks',
-                    content_rowid='id'
+                    content_rowid='id',
+                    prefix='2 3 4'
                 )
                 """
             )
+            if rebuild_fts:
+                cur.execute("INSERT INTO rag_chunks_fts(rag_chunks_fts) VALUES ('rebuild')")
 
             # Keep FTS in sync
             cur.execute(
@@ -240,15 +466,53 @@ class ArxivAbstractRAG:
                     dim INTEGER NOT NULL,
                     embedding BLOB NOT NULL,
                     content_hash TEXT NOT NULL,
-                    created_at INTEGER NOT NULL
+                    created_at INTEGER NOT NULL,
+                    dtype TEXT NOT NULL DEFAULT 'f32',
+                    unit_norm INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            # Migrate caches created before the dtype/unit_norm columns existed
+            # (those rows are raw, unnormalized f32).
+            emb_cols = {r["name"] for r in cur.execute("PRAGMA table_info(rag_embeddings)")}
+            if "dtype" not in emb_cols:
+                cur.execute("ALTER TABLE rag_embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'f32'")
+            if "unit_norm" not in emb_cols:
+                cur.execute("ALTER TABLE rag_embeddings ADD COLUMN unit_norm INTEGER NOT NULL DEFAULT 0")
+
+            # Chunked output per (file, content hash), so reverting a file to an earlier
+            # version re-inserts its chunks without re-reading or re-splitting it.
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rag_chunk_cache (
+                    source_file TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    chunks_json TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    PRIMARY KEY (source_file, content_hash)
                 )
                 """
             )
 
+            # Index-range scans for per-model embedding reads and per-file chunk deletes.
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_emb_model ON rag_embeddings(model, chunk_id)"
+            )
+            cur.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chunks_source ON rag_chunks(source_file)"
+            )
+
             conn.commit()
 
         self._index_docs_incremental()
 
+        # Fingerprint taken before indexing: files changed mid-pass force a rerun next time.
+        self._indexed_fingerprint = fingerprint
+        try:
+            self.fingerprint_path.write_text(fingerprint, encoding="utf-8")
+        except OSError:
+            pass
+
         # Only precompute embeddings if explicitly enabled
         if self.enable_semantic:
             self._ensure_embeddings_cached()
@@ -260,53 +524,118 @@ class ArxivAbstractRAG:
 
         with self._connect() as conn:
             cur = conn.cursor()
+            # source_file -> (file_hash, mtime_ns, size), loaded once instead of per file.
+            known: Dict[str, Tuple[str, Optional[int], Optional[int]]] = {
+                r["source_file"]: (r["file_hash"], r["mtime_ns"], r["size"])
+                for r in cur.execute("SELECT source_file, file_hash, mtime_ns, size FROM rag_sources")
+            }
+
+            # One explicit transaction for the whole pass (FTS triggers included).
+            conn.execute("BEGIN")
 
             for md_path in md_files:
+                row = known.get(md_path.name)
                 try:
-                    text = md_path.read_text(encoding="utf-8")
+                    st = md_path.stat()
+                    if row and row[1:] == (st.st_mtime_ns, st.st_size):
+                        continue  # unchanged since last index (no read, no hash)
+
+                    file_hash = _hash_file(md_path)
+                    if row and row[0] == file_hash:
+                        # Touched but identical content: just refresh the stat sentinel.
+                        cur.execute(
+                            "UPDATE rag_sources SET mtime_ns = ?, size = ? WHERE source_file = ?",
+                            (st.st_mtime_ns, st.st_size, md_path.name),
+                        )
+                        continue
+
+                    cached = cur.execute(
+                        "SELECT chunks_json FROM rag_chunk_cache WHERE source_file = ? AND content_hash = ?",
+                        (md_path.name, file_hash),
+                    ).fetchone()
+                    if cached:
+                        # [[section_title, content, content_hash], ...]
+                        chunk_items = json.loads(cached["chunks_json"])
+                    else:
+                        text = md_path.read_text(encoding="utf-8")
+                        chunk_items = []
+                        for ch in chunk_markdown_by_h2(text, md_path.name):
+                            content = ch["content"]
+                            meta = ch.get("metadata") or {}
+                            section_title = str(meta.get("section_title") or "Section")
+                            chunk_items.append([section_title, content, _hash_text(content)])
                 except Exception:
                     # Skip unreadable files
                     continue
 
-                file_hash = _sha256_text(text)
-                row = cur.execute(
-                    "SELECT file_hash FROM rag_sources WHERE source_file = ?",
-                    (md_path.name,),
-                ).fetchone()
-                if row and row["file_hash"] == file_hash:
-                    continue  # unchanged
+                indexed_at = _now_s()
+                if cached:
+                    cur.execute(
+                        "UPDATE rag_chunk_cache SET created_at = ? WHERE source_file = ? AND content_hash = ?",
+                        (indexed_at, md_path.name, file_hash),
+                    )
+                else:
+                    self._store_chunk_cache(cur, md_path.name, file_hash, chunk_items, indexed_at)
 
                 # Re-index by deleting old chunks for that file then inserting fresh.
                 cur.execute("DELETE FROM rag_chunks WHERE source_file = ?", (md_path.name,))
 
-                chunks = chunk_markdown_by_h2(text, md_path.name)
-                indexed_at = _now_s()
-                for ch in chunks:
-                    content = ch["content"]
-                    meta = ch.get("metadata") or {}
-                    section_title = str(meta.get("section_title") or "Section")
-                    content_hash = _sha256_text(content)
-                    cur.execute(
-                        """
-                        INSERT INTO rag_chunks (source_file, section_title, content, content_hash, indexed_at)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        (md_path.name, section_title, content, content_hash, indexed_at),
-                    )
+                chunk_rows: List[Tuple[str, str, str, str, int]] = [
+                    (md_path.name, section_title, content, content_hash, indexed_at)
+                    for section_title, content, content_hash in chunk_items
+                ]
+                cur.executemany(
+                    """
+                    INSERT INTO rag_chunks (source_file, section_title, content, content_hash, indexed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    chunk_rows,
+                )
 
                 cur.execute(
                     """
-                    INSERT INTO rag_sources (source_file, file_hash, indexed_at)
-                    VALUES (?, ?, ?)
+                    INSERT INTO rag_sources (source_file, file_hash, indexed_at, mtime_ns, size)
+                    VALUES (?, ?, ?, ?, ?)
                     ON CONFLICT(source_file) DO UPDATE SET
                         file_hash=excluded.file_hash,
-                        indexed_at=excluded.indexed_at
+                        indexed_at=excluded.indexed_at,
+                        mtime_ns=excluded.mtime_ns,
+                        size=excluded.size
                     """,
-                    (md_path.name, file_hash, indexed_at),
+                    (md_path.name, file_hash, indexed_at, st.st_mtime_ns, st.st_size),
                 )
 
             conn.commit()
 
+    @staticmethod
+    def _store_chunk_cache(
+        cur: sqlite3.Cursor,
+        source_file: str,
+        file_hash: str,
+        chunk_items: List[List[str]],
+        created_at: int,
+    ) -> None:
+        """Remember a file version's chunks, keeping only the newest few versions per file."""
+        cur.execute(
+            """
+            INSERT OR REPLACE INTO rag_chunk_cache (source_file, content_hash, chunks_json, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            (source_file, file_hash, json.dumps(chunk_items, ensure_ascii=False), created_at),
+        )
+        cur.execute(
+            """
+            DELETE FROM rag_chunk_cache
+            WHERE source_file = ? AND content_hash NOT IN (
+                SELECT content_hash FROM rag_chunk_cache
+                WHERE source_file = ?
+                ORDER BY created_at DESC, rowid DESC
+                LIMIT ?
+            )
+            """,
+            (source_file, source_file, _CHUNK_CACHE_VERSIONS),
+        )
+
     def _openrouter_embed(self, texts: List[str]) -> List[List[float]]:
         if not texts:
             return []
@@ -315,14 +644,8 @@ class ArxivAbstractRAG:
         if not self.openrouter_api_key:
             raise RuntimeError("OpenRouter API key missing (needed for embeddings)")
 
-        resp = requests.post(
+        resp = self._session().post(
             "https://openrouter.ai/api/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {self.openrouter_api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/dailytoparxiv/post_generation",
-                "X-Title": "Post Generation Tool",
-            },
             json={"model": self.embedding_model, "input": texts},
             timeout=60,
         )
@@ -336,10 +659,14 @@ class ArxivAbstractRAG:
             out.append([float(x) for x in emb])
         return out
 
-    def _ensure_embeddings_cached(self, batch_size: int = 64) -> None:
+    def _ensure_embeddings_cached(
+        self, batch_size: int = 64, max_workers: int = _HTTP_POOL_SIZE
+    ) -> None:
         """
         Ensure we have cached embeddings for all chunks (for current model + content_hash).
         Safe to call repeatedly; only embeds missing/outdated chunks.
+        Up to `max_workers` API batches are in flight at once; SQLite writes stay on
+        this thread.
         """
         if not self.enable_semantic:
             return
@@ -363,41 +690,153 @@ class ArxivAbstractRAG:
             if not rows:
                 return
 
+            self.invalidate_embedding_cache()
             pending: List[Tuple[int, str, str]] = [
                 (int(r["id"]), str(r["content"]), str(r["content_hash"])) for r in rows
             ]
 
-            for i in range(0, len(pending), batch_size):
-                batch = pending[i : i + batch_size]
-                texts = [b[1] for b in batch]
-                try:
-                    embeddings = self._openrouter_embed(texts)
-                except Exception:
-                    # If embeddings fail (model unsupported, quota, etc.), don't break workflow.
-                    return
-
-                created_at = _now_s()
-                for (chunk_id, _content, content_hash), emb in zip(batch, embeddings):
-                    dim = len(emb)
-                    if dim <= 0:
-                        continue
-                    blob = _pack_f32(emb)
-                    cur.execute(
+            batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+            if requests is not None:
+                self._session()  # create once here, not racily inside the workers
+
+            conn.execute("BEGIN")
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [
+                    executor.submit(self._openrouter_embed, [b[1] for b in batch])
+                    for batch in batches
+                ]
+                for batch, future in zip(batches, futures):
+                    try:
+                        embeddings = future.result()
+                    except Exception:
+                        # If embeddings fail (model unsupported, quota, etc.), don't break
+                        # workflow; keep whatever batches already succeeded.
+                        for f in futures:
+                            f.cancel()
+                        break
+
+                    created_at = _now_s()
+                    emb_rows = [
+                        (
+                            chunk_id,
+                            self.embedding_model,
+                            len(emb),
+                            _pack_embedding(emb, self.storage_dtype),
+                            content_hash,
+                            created_at,
+                            self.storage_dtype,
+                            1,
+                        )
+                        for (chunk_id, _content, content_hash), emb in zip(batch, embeddings)
+                        if emb
+                    ]
+                    cur.executemany(
                         """
-                        INSERT INTO rag_embeddings (chunk_id, model, dim, embedding, content_hash, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?)
+                        INSERT INTO rag_embeddings
+                            (chunk_id, model, dim, embedding, content_hash, created_at, dtype, unit_norm)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                         ON CONFLICT(chunk_id) DO UPDATE SET
                             model=excluded.model,
                             dim=excluded.dim,
                             embedding=excluded.embedding,
                             content_hash=excluded.content_hash,
-                            created_at=excluded.created_at
+                            created_at=excluded.created_at,
+                            dtype=excluded.dtype,
+                            unit_norm=excluded.unit_norm
                         """,
-                        (chunk_id, self.embedding_model, dim, blob, content_hash, created_at),
+                        emb_rows,
                     )
 
             conn.commit()
 
+    def _load_embedding_matrix(
+        self, cur: sqlite3.Cursor, model: str
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Load cached embeddings for `model` as (chunk_ids, row-normalized float32 matrix).
+        `cur` may be a plain-tuple cursor (rows are unpacked positionally).
+        Rows are decoded straight from the BLOBs with np.frombuffer (no Python float lists);
+        f16 rows are upcast to f32 on the way into the matrix. Rows stored pre-normalized
+        (unit_norm=1) are used as-is; only legacy rows are normalized here.
+        """
+        rows = cur.execute(
+            """
+            SELECT chunk_id, dim, dtype, unit_norm, embedding
+            FROM rag_embeddings
+            WHERE model = ?
+            """,
+            (model,),
+        ).fetchall()
+
+        dim = int(rows[0][1]) if rows else 0
+        ids = np.empty(len(rows), dtype=np.int64)
+        mat = np.empty((len(rows), dim), dtype=np.float32)
+        raw = np.zeros(len(rows), dtype=bool)
+        n = 0
+        for chunk_id, row_dim, dtype, unit_norm, blob in rows:
+            if row_dim != dim:
+                continue
+            ids[n] = chunk_id
+            blob_dtype = np.float16 if dtype == "f16" else np.float32
+            mat[n] = np.frombuffer(blob, dtype=blob_dtype, count=dim)
+            raw[n] = not unit_norm
+            n += 1
+        ids, mat, raw = ids[:n], mat[:n], raw[:n]
+
+        if raw.any():
+            norms = np.linalg.norm(mat[raw], axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            mat[raw] /= norms
+        return ids, mat
+
+    def _embedding_matrix(self, cur: sqlite3.Cursor) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Return the normalized embedding matrix for the current model, reusing the
+        in-memory copy while the (row count, max chunk_id) sentinel is unchanged.
+        """
+        model = self.embedding_model
+        count, max_id = cur.execute(
+            "SELECT COUNT(*), COALESCE(MAX(chunk_id), 0) FROM rag_embeddings WHERE model = ?",
+            (model,),
+        ).fetchone()
+        cache = self._emb_cache
+        if cache is not None and cache[:3] == (model, int(count), int(max_id)):
+            return cache[3], cache[4]
+
+        ids, mat = self._load_embedding_matrix(cur, model)
+        self._emb_cache = (model, int(count), int(max_id), ids, mat)
+        return ids, mat
+
+    def invalidate_embedding_cache(self) -> None:
+        """Drop the in-memory embedding matrix (next semantic query reloads it)."""
+        self._emb_cache = None
+
+    @staticmethod
+    def _semantic_scores(
+        ids: "np.ndarray", mat: "np.ndarray", q_emb: Sequence[float], limit: int
+    ) -> Dict[int, float]:
+        """
+        Cosine similarity of `q_emb` against every row of the normalized matrix `mat`;
+        returns the top `limit` as {chunk_id: similarity}.
+        """
+        q = np.asarray(q_emb, dtype=np.float32)
+        if mat.shape[0] == 0 or q.shape[0] != mat.shape[1]:
+            return {}
+        q_norm = float(np.linalg.norm(q))
+        if q_norm == 0.0:
+            return {}
+        q /= q_norm
+
+        if simsimd is not None:
+            dists = np.asarray(simsimd.cdist(q[None, :], mat, metric="cosine"), dtype=np.float32)
+            sims = 1.0 - dists.reshape(-1)
+        else:
+            sims = mat @ q
+
+        idx = _top_k_indices(sims, limit)
+        return dict(zip(ids[idx].tolist(), sims[idx].tolist()))
+
     def retrieve(
         self,
         query: str,
@@ -419,26 +858,37 @@ class ArxivAbstractRAG:
 
         bm25_hits: Dict[int, float] = {}
         semantic_hits: Dict[int, float] = {}
+        # chunk_id -> (source_file, section_title, content)
+        chunk_rows: Dict[int, Tuple[str, str, str]] = {}
 
         with self._connect() as conn:
             cur = conn.cursor()
+            # Plain tuples in the hot loops below: no per-row sqlite3.Row wrapper.
+            cur.row_factory = None
 
-            # BM25 keyword search
+            # BM25 keyword search, joined with rag_chunks so keyword hits come back with
+            # their content in the same statement. ORDER BY rank (= bm25 by default) so
+            # LIMIT keeps the best matches; FTS5 sorts this internally.
             safe_query = _safe_fts_query(query)
             if safe_query:
                 try:
                     rows = cur.execute(
                         """
-                        SELECT rowid, bm25(rag_chunks_fts) AS score
+                        SELECT c.id, c.source_file, c.section_title, c.content,
+                               bm25(rag_chunks_fts) AS score
                         FROM rag_chunks_fts
+                        JOIN rag_chunks c ON c.id = rag_chunks_fts.rowid
                         WHERE rag_chunks_fts MATCH ?
+                        ORDER BY rank
                         LIMIT ?
                         """,
                         (safe_query, bm25_limit),
                     ).fetchall()
-                    bm25_hits = {int(r["rowid"]): float(r["score"]) for r in rows}
+                    bm25_hits = {cid: float(score) for cid, _sf, _st, _c, score in rows}
+                    chunk_rows = {cid: (sf, st, c) for cid, sf, st, c, _score in rows}
                 except sqlite3.OperationalError:
                     bm25_hits = {}
+                    chunk_rows = {}
 
             # Optional semantic search
             if self.enable_semantic and self.openrouter_api_key:
@@ -449,50 +899,56 @@ class ArxivAbstractRAG:
                 except Exception:
                     q_emb = []
 
-                if q_emb:
-                    # Compute cosine sim against cached embeddings (small corpus -> OK in Python).
+                if q_emb and np is not None:
+                    ids, mat = self._embedding_matrix(cur)
+                    semantic_hits = self._semantic_scores(ids, mat, q_emb, semantic_limit)
+                elif q_emb:
+                    # No NumPy: cosine sim in Python (small corpus -> OK).
                     emb_rows = cur.execute(
                         """
-                        SELECT e.chunk_id, e.dim, e.embedding
+                        SELECT e.chunk_id, e.dim, e.dtype, e.unit_norm, e.embedding
                         FROM rag_embeddings e
                         WHERE e.model = ?
                         """,
                         (self.embedding_model,),
                     ).fetchall()
 
+                    q_norm = math.sqrt(math.fsum(x * x for x in q_emb))
+                    q_unit = [x / q_norm for x in q_emb] if q_norm > 0.0 else []
                     scored: List[Tuple[int, float]] = []
-                    for r in emb_rows:
-                        dim = int(r["dim"])
-                        vec = _unpack_f32(r["embedding"], dim)
-                        sim = _cosine_similarity(q_emb, vec)
-                        scored.append((int(r["chunk_id"]), float(sim)))
-
-                    scored.sort(key=lambda x: x[1], reverse=True)
-                    semantic_hits = dict(scored[:semantic_limit])
-
-            # Merge candidates
-            candidate_ids = set(bm25_hits.keys()) | set(semantic_hits.keys())
-            if not candidate_ids:
+                    for chunk_id, dim, dtype, unit_norm, blob in emb_rows:
+                        vec = _unpack_embedding(blob, int(dim), dtype)
+                        if unit_norm and q_unit and len(vec) == len(q_unit):
+                            sim = math.fsum(x * y for x, y in zip(q_unit, vec))
+                        else:
+                            sim = _cosine_similarity(q_emb, vec)
+                        scored.append((int(chunk_id), float(sim)))
+
+                    semantic_hits = dict(heapq.nlargest(semantic_limit, scored, key=lambda x: x[1]))
+
+            # Merge candidates: only semantic-only hits still need their content fetched.
+            if not bm25_hits and not semantic_hits:
                 return "", []
 
-            # Fetch chunk content
-            placeholders = ",".join(["?"] * len(candidate_ids))
-            chunk_rows = cur.execute(
-                f"""
-                SELECT id, source_file, section_title, content
-                FROM rag_chunks
-                WHERE id IN ({placeholders})
-                """,
-                list(candidate_ids),
-            ).fetchall()
+            missing_ids = [cid for cid in semantic_hits if cid not in chunk_rows]
+            if missing_ids:
+                placeholders = ",".join(["?"] * len(missing_ids))
+                for cid, sf, st, c in cur.execute(
+                    f"""
+                    SELECT id, source_file, section_title, content
+                    FROM rag_chunks
+                    WHERE id IN ({placeholders})
+                    """,
+                    missing_ids,
+                ):
+                    chunk_rows[cid] = (sf, st, c)
 
         # Normalize scores
         bm25_norm = self._normalize_bm25(bm25_hits)
         sem_norm = self._normalize_01(semantic_hits)
 
         hits: List[RAGHit] = []
-        for r in chunk_rows:
-            cid = int(r["id"])
+        for cid, (source_file, section_title, content) in chunk_rows.items():
             b = float(bm25_norm.get(cid, 0.0))
             s = float(sem_norm.get(cid, 0.0))
             # If semantic is disabled/unavailable, fall back to pure keyword.
@@ -506,17 +962,16 @@ class ArxivAbstractRAG:
             hits.append(
                 RAGHit(
                     chunk_id=cid,
-                    source_file=str(r["source_file"]),
-                    section_title=str(r["section_title"]),
-                    content=str(r["content"]),
+                    source_file=source_file,
+                    section_title=section_title,
+                    content=content,
                     bm25_score=b,
                     semantic_score=s,
                     final_score=float(final),
                 )
             )
 
-        hits.sort(key=lambda h: h.final_score, reverse=True)
-        hits = hits[:top_k]
+        hits = heapq.nlargest(top_k, hits, key=lambda h: h.final_score)
 
         context = self.format_context(hits, max_chars=max_chars)
         return context, hits
@@ -527,48 +982,35 @@ class ArxivAbstractRAG:
         FTS5 bm25() returns negative numbers (more negative = better).
         Convert to [0, 1] where 1 is best.
         """
-        if not scores:
-            return {}
-        vals = list(scores.values())
-        mn = min(vals)  # most negative (best)
-        mx = max(vals)  # least negative (worst)
-        if mn == mx:
-            return {k: 1.0 for k in scores}
-        rng = mx - mn
-        return {k: (mx - v) / rng for k, v in scores.items()}
+        return _minmax_normalize(scores, invert=True)
 
     @staticmethod
     def _normalize_01(scores: Dict[int, float]) -> Dict[int, float]:
-        if not scores:
-            return {}
-        vals = list(scores.values())
-        mn = min(vals)
-        mx = max(vals)
-        if mn == mx:
-            return {k: 1.0 for k in scores}
-        rng = mx - mn
-        return {k: (v - mn) / rng for k, v in scores.items()}
+        return _minmax_normalize(scores)
 
     @staticmethod
     def format_context(hits: Sequence[RAGHit], max_chars: int = 4000) -> str:
         if not hits:
             return ""
 
-        parts: List[str] = []
-        used = 0
+        buf = io.StringIO()
+        remaining = max_chars
         for i, h in enumerate(hits, 1):
             header = f"[{i}] {h.source_file} :: {h.section_title} (score={h.final_score:.2f})"
             body = h.content.strip()
 
-            avail = max_chars - used - len(header) - 5
+            avail = remaining - len(header) - 5
             if avail <= 200:
                 break
             if len(body) > avail:
                 body = body[: avail - 3] + "..."
 
-            entry = f"{header}\n{body}\n"
-            parts.append(entry)
-            used += len(entry)
-
-        return "\n".join(parts).strip()
+            if i > 1:
+                buf.write("\n")
+            buf.write(header)
+            buf.write("\n")
+            buf.write(body)
+            buf.write("\n")
+            remaining -= len(header) + len(body) + 2
 
+        return buf.getvalue().strip()
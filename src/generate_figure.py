@@ -4,20 +4,101 @@ Image generation script using Replicate's Flux model.
 Generates images from text prompts without training functionality.
 """
 
+import io
 import os
 import json
+import shutil
+import hashlib
+import threading
+import time
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 import replicate
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Any, Literal
+
+# requests and Pillow are only needed for downloads, so they are imported on
+# first use (see _import_image_libs) rather than at module load
+requests = None
+Image = None
+
+# orjson is optional; fall back to the stdlib with matching (compact, sorted) output
 try:
-    import requests
-    from PIL import Image
-    IMAGE_LIBS_AVAILABLE = True
+    import orjson
+    
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
 except ImportError:
-    IMAGE_LIBS_AVAILABLE = False
-    requests = None
-    Image = None
+    orjson = None
+    
+    def _json_loads(data: bytes):
+        return json.loads(data)
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, sort_keys=True, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+__all__ = [
+    "load_config",
+    "download_image",
+    "setup_replicate",
+    "generate_image",
+    "generate_images_batch",
+    "generate_image_finetuned",
+    "wait_all",
+]
+
+# PNG file signature and the IHDR colour type for 8-bit truecolour (RGB)
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_COLOR_TYPE_RGB = 2
+
+# File suffix for each supported output format
+OUTPUT_SUFFIXES = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+# Prediction states after which polling stops
+TERMINAL_STATUSES = ("succeeded", "failed", "canceled")
+
+# Resolved once at import; default config and image paths hang off the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_IMAGES_DIR = _PROJECT_ROOT / ".images"
+
+# Output directories already created in this process
+_ENSURED_DIRS = set()
+
+# Shared pool for image downloads, so PNG encoding and socket reads overlap
+# with the next prediction instead of blocking it
+DOWNLOAD_WORKERS = 4
+_downloader = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="image-download")
+
+# Small separate pool for metadata lookups, so they never queue behind downloads
+_lookup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="replicate-lookup")
+
+# Latest fine-tune version per (owner, name), re-resolved after this many
+# seconds so newly pushed versions are picked up by long-running processes
+VERSION_CACHE_TTL = 300.0
+_version_cache: Dict[tuple, tuple] = {}
+_version_cache_lock = threading.Lock()
+
+# Keep-alive session shared by all downloads (created on first use)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# Index of seeded generations -> saved file, kept next to the images
+IMAGE_CACHE_FILENAME = "cache.json"
+_image_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict:
+    """Parse a config file; keyed by mtime so edits are picked up on the next call."""
+    with open(path_str, 'rb') as f:
+        return _json_loads(f.read())
 
 
 def load_config(config_path: Optional[str] = None) -> Dict:
@@ -35,98 +116,185 @@ def load_config(config_path: Optional[str] = None) -> Dict:
         ValueError: If config file is invalid
     """
     if config_path is None:
-        # Get the project root (assuming this file is in src/image_generation/)
-        project_root = Path(__file__).parent.parent
-        config_path = project_root / ".config" / "replicate_config.json"
+        config_path = _PROJECT_ROOT / ".config" / "replicate_config.json"
     else:
         config_path = Path(config_path)
     
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Config file not found at {config_path}. "
             f"Please copy .config/replicate_config.json.example to .config/replicate_config.json "
             f"and fill in your credentials."
-        )
+        ) from None
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    # Shallow copy so callers can't mutate the cached dict
+    return dict(_load_config_cached(str(config_path), mtime_ns))
+
+
+def _import_image_libs():
+    """Import requests and Pillow the first time an image is downloaded."""
+    global requests, Image
+    if Image is not None:
+        return
+    try:
+        import requests as requests_module
+        from PIL import Image as image_module
+    except ImportError:
+        raise ImportError(
+            "Image download requires 'requests' and 'Pillow' libraries. "
+            "Install with: pip install requests Pillow"
+        ) from None
+    # Bind requests first: Image doubles as the "already imported" flag
+    requests = requests_module
+    Image = image_module
+
+
+def _sniff_extension(header: bytes) -> str:
+    """Guess a file extension from an image's leading magic bytes."""
+    if header.startswith(PNG_SIGNATURE):
+        return ".png"
+    if header[:3] == b"\xff\xd8\xff":
+        return ".jpg"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    return ".bin"
+
+
+def _ensure_dir(path: Path):
+    """Create a directory once per process; later calls skip the mkdir syscall."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _get_http_session() -> "requests.Session":
+    """
+    Return the shared download session, creating it on first use.
     
-    return config
+    Images from a batch come from the same CDN host, so reusing pooled
+    connections skips a TCP + TLS handshake per download. The pool is sized
+    to the download worker count so concurrent downloads don't block.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=DOWNLOAD_WORKERS
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
 
 
-def download_image(url: str, output_dir: Optional[Path] = None, filename: Optional[str] = None) -> Path:
+def download_image(
+    url: str,
+    output_dir: Optional[Path] = None,
+    filename: Optional[str] = None,
+    png_compress_level: int = 1,
+    output_format: Literal["png", "jpeg", "webp"] = "png"
+) -> Path:
     """
-    Download an image from a URL and save it as PNG in the .images folder.
+    Download an image from a URL and save it in the .images folder.
     
     Args:
         url: URL of the image to download
         output_dir: Directory to save the image. If None, uses .images in project root
         filename: Optional filename. If None, generates a timestamp-based name
+        png_compress_level: zlib level (0-9) used when re-encoding to PNG. The default
+                            of 1 is several times faster than Pillow's default at a
+                            slightly larger file; 9 also enables optimize for the
+                            smallest output at the cost of encode time.
+        output_format: "png" (default), "jpeg" or "webp". JPEG/WebP encode much
+                       faster than PNG and are far smaller for photographic images.
     
     Returns:
         Path to the saved image file
     
     Raises:
         ImportError: If requests or PIL are not installed
+        ValueError: If output_format is not supported
         Exception: If download or conversion fails
     """
-    if not IMAGE_LIBS_AVAILABLE:
-        raise ImportError(
-            "Image download requires 'requests' and 'Pillow' libraries. "
-            "Install with: pip install requests Pillow"
+    if output_format not in OUTPUT_SUFFIXES:
+        raise ValueError(
+            f"Unsupported output_format '{output_format}'. "
+            f"Choose one of: {', '.join(OUTPUT_SUFFIXES)}"
         )
+    suffix = OUTPUT_SUFFIXES[output_format]
+    
+    _import_image_libs()
     
     # Determine output directory
     if output_dir is None:
-        project_root = Path(__file__).parent.parent
-        output_dir = project_root / ".images"
+        output_dir = _DEFAULT_IMAGES_DIR
     else:
         output_dir = Path(output_dir)
     
     # Create directory if it doesn't exist
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_dir)
     
-    # Generate filename if not provided
+    # Generate filename if not provided (ns timestamp in hex: unique and sortable)
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"generated_image_{timestamp}.png"
+        filename = f"img_{time.time_ns():x}{suffix}"
     
-    # Ensure filename ends with .png
-    if not filename.endswith('.png'):
-        filename = f"{Path(filename).stem}.png"
+    # Ensure filename ends with the format's suffix
+    if not filename.endswith(suffix):
+        filename = f"{Path(filename).stem}{suffix}"
     
-    # Download the image
+    # Download the image straight into memory
     print(f"Downloading image from {url}...")
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    
-    # Save temporarily to check format
-    temp_path = output_dir / f"temp_{filename}"
-    with open(temp_path, 'wb') as f:
-        f.write(response.content)
-    
-    # Convert to PNG
+    buf = io.BytesIO()
+    with _get_http_session().get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buf)
+    buf.seek(0)
+    
+    output_path = output_dir / filename
+    
+    # Already an opaque 8-bit RGB PNG: keep the bytes as-is, no re-encode needed
+    with buf.getbuffer() as view:
+        header = bytes(view[:26])
+    if (output_format == "png" and len(header) >= 26
+            and header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR"
+            and header[24] == 8 and header[25] == PNG_COLOR_TYPE_RGB):
+        output_path.write_bytes(buf.getvalue())
+        print(f"✓ Image saved to: {output_path}")
+        return output_path
+    
+    # Convert to the requested format
     try:
-        img = Image.open(temp_path)
+        img = Image.open(buf)
         # Convert to RGB if necessary (handles RGBA, etc.)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
+        if img.mode == 'P' and 'transparency' not in img.info:
+            # Opaque palette image: expand straight to RGB, nothing to composite
+            img = img.convert('RGB')
+        elif img.mode in ('RGBA', 'LA', 'P'):
+            # Flatten onto white in one C-level composite, no mask split needed
+            if img.mode != 'RGBA':
                 img = img.convert('RGBA')
-            rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-            img = rgb_img
+            background = Image.new('RGBA', img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(background, img).convert('RGB')
         elif img.mode != 'RGB':
             img = img.convert('RGB')
         
-        # Save as PNG
-        output_path = output_dir / filename
-        img.save(output_path, 'PNG')
-        temp_path.unlink()  # Remove temporary file
+        if output_format == "jpeg":
+            img.save(output_path, 'JPEG', quality=90, optimize=True)
+        elif output_format == "webp":
+            img.save(output_path, 'WEBP', quality=90, method=4)
+        else:
+            img.save(output_path, 'PNG', optimize=png_compress_level >= 9, compress_level=png_compress_level)
     except Exception as e:
-        print(f"Warning: Could not convert image to PNG: {e}")
-        # Fallback: rename temp file
-        output_path = output_dir / filename
-        temp_path.rename(output_path)
+        print(f"Warning: Could not convert image to {output_format.upper()}: {e}")
+        # Fallback: write the downloaded bytes unchanged, named after their real format
+        output_path = output_path.with_suffix(_sniff_extension(header))
+        output_path.write_bytes(buf.getvalue())
         print(f"Image saved as-is to {output_path}")
     
     print(f"✓ Image saved to: {output_path}")
@@ -152,6 +320,210 @@ def setup_replicate(api_key: Optional[str] = None, config: Optional[Dict] = None
         )
 
 
+def _build_input(
+    prompt: str,
+    num_inference_steps: int,
+    guidance_scale: float,
+    model_type: str,
+    seed: Optional[int] = None
+) -> Dict:
+    """Build the Replicate input payload shared by all generation entry points."""
+    input_params = {
+        "prompt": prompt,
+        "num_inference_steps": num_inference_steps,
+        "guidance_scale": guidance_scale,
+        "model": model_type,
+    }
+    if seed is not None:
+        input_params["seed"] = seed
+    return input_params
+
+
+def _image_cache_file(output_dir: Optional[Path]) -> Path:
+    """Location of the generation cache index for an output directory."""
+    if output_dir is None:
+        output_dir = _DEFAULT_IMAGES_DIR
+    return Path(output_dir) / IMAGE_CACHE_FILENAME
+
+
+def _image_cache_key(model: Any, input_params: Dict, output_format: str) -> str:
+    """Hash everything that determines a seeded generation's saved file."""
+    payload = _json_dumps({"model": str(model), "input": input_params, "format": output_format})
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _read_image_cache(cache_file: Path) -> Dict[str, str]:
+    """Read the cache index, treating a missing or corrupt file as empty."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return _json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _lookup_cached_image(cache_key: Optional[str], output_dir: Optional[Path]) -> Optional[Dict]:
+    """Return a cached result for cache_key if its image is still on disk."""
+    if cache_key is None:
+        return None
+    with _image_cache_lock:
+        file_path = _read_image_cache(_image_cache_file(output_dir)).get(cache_key)
+    if file_path and Path(file_path).exists():
+        print(f"✓ Reusing cached image: {file_path}")
+        return {"url": None, "file_path": file_path, "cached": True}
+    return None
+
+
+def _record_cached_image(cache_key: str, output_dir: Optional[Path], file_path: Path):
+    """Add a downloaded image to the cache index."""
+    cache_file = _image_cache_file(output_dir)
+    with _image_cache_lock:
+        cache = _read_image_cache(cache_file)
+        cache[cache_key] = str(file_path)
+        _ensure_dir(cache_file.parent)
+        temp_file = cache_file.with_suffix(".tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(_json_dumps(cache, indent=True))
+        os.replace(temp_file, cache_file)
+
+
+def _download_and_record(
+    url: str,
+    output_dir: Optional[Path],
+    filename: Optional[str],
+    png_compress_level: int,
+    output_format: str,
+    cache_key: Optional[str]
+) -> Path:
+    """Download an image and, for seeded generations, remember where it was saved."""
+    file_path = download_image(url, output_dir, filename, png_compress_level, output_format)
+    if cache_key is not None:
+        _record_cached_image(cache_key, output_dir, file_path)
+    return file_path
+
+
+def _finish_result(
+    generated_img_url: str,
+    download: bool,
+    output_dir: Optional[Path],
+    filename: Optional[str],
+    png_compress_level: int = 1,
+    output_format: str = "png",
+    background_download: bool = False,
+    cache_key: Optional[str] = None
+) -> Dict[str, str]:
+    """Build the result dictionary, downloading the image if requested."""
+    result = {"url": generated_img_url}
+    
+    # Hand the download to the shared pool; wait_all() collects it later
+    if download and background_download:
+        result["download"] = _downloader.submit(
+            _download_and_record, generated_img_url, output_dir, filename,
+            png_compress_level, output_format, cache_key
+        )
+        return result
+    
+    # Download image if requested
+    if download:
+        try:
+            file_path = _download_and_record(
+                generated_img_url, output_dir, filename, png_compress_level, output_format, cache_key
+            )
+            result["file_path"] = str(file_path)
+        except Exception as e:
+            print(f"Warning: Failed to download image: {e}")
+            print(f"Image URL: {generated_img_url}")
+    
+    return result
+
+
+def wait_all(results: List[Dict]) -> List[Dict]:
+    """
+    Wait for background downloads started with background_download=True.
+    
+    Each pending download is replaced by its 'file_path' once finished; a
+    failed download is reported and left without a 'file_path', matching the
+    behaviour of a foreground download.
+    
+    Args:
+        results: Result dictionaries returned by generate_image / generate_image_finetuned
+    
+    Returns:
+        The same list, with downloads resolved in place
+    """
+    for result in results:
+        future = result.pop("download", None)
+        if future is None:
+            continue
+        try:
+            result["file_path"] = str(future.result())
+        except Exception as e:
+            print(f"Warning: Failed to download image: {e}")
+            print(f"Image URL: {result.get('url')}")
+    return results
+
+
+def _prediction_target(model: Any) -> Dict:
+    """Map a model reference to the keyword replicate.predictions.create expects."""
+    if isinstance(model, str):
+        if ":" in model:
+            return {"version": model.split(":", 1)[1]}
+        return {"model": model}
+    # A replicate Version object
+    return {"version": model}
+
+
+def _check_prediction(prediction) -> Any:
+    """Return the output of a finished prediction, raising if it did not succeed."""
+    if prediction.status != "succeeded":
+        raise replicate.exceptions.ModelError(prediction)
+    return prediction.output
+
+
+def _run_prediction(
+    model: Any,
+    input_params: Dict,
+    initial_poll: float = 0.25,
+    poll_interval: float = 2.0
+) -> Any:
+    """
+    Create a prediction and poll it until it finishes.
+    
+    Polling starts at initial_poll seconds and backs off by 1.5x up to
+    poll_interval, so fast jobs return quickly while slow ones don't flood
+    the API with status requests.
+    """
+    prediction = replicate.predictions.create(input=input_params, **_prediction_target(model))
+    delay = initial_poll
+    while prediction.status not in TERMINAL_STATUSES:
+        time.sleep(delay)
+        delay = min(delay * 1.5, poll_interval)
+        prediction.reload()
+    return _check_prediction(prediction)
+
+
+async def _async_run_prediction(
+    client: "replicate.Client",
+    model: Any,
+    input_params: Dict,
+    initial_poll: float = 0.25,
+    poll_interval: float = 2.0
+) -> Any:
+    """
+    Async counterpart of _run_prediction.
+    
+    Takes an explicit client: replicate's module-level client caches an
+    httpx.AsyncClient bound to the first event loop it ran on, so it can't be
+    reused across asyncio.run() calls.
+    """
+    prediction = await client.predictions.async_create(input=input_params, **_prediction_target(model))
+    delay = initial_poll
+    while prediction.status not in TERMINAL_STATUSES:
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, poll_interval)
+        await prediction.async_reload()
+    return _check_prediction(prediction)
+
+
 def generate_image(
     prompt: str,
     model: str = "black-forest-labs/flux-dev",
@@ -162,7 +534,13 @@ def generate_image(
     config: Optional[Dict] = None,
     download: bool = True,
     output_dir: Optional[Path] = None,
-    filename: Optional[str] = None
+    filename: Optional[str] = None,
+    initial_poll: float = 0.25,
+    poll_interval: float = 2.0,
+    png_compress_level: int = 1,
+    output_format: Literal["png", "jpeg", "webp"] = "png",
+    background_download: bool = False,
+    seed: Optional[int] = None
 ) -> Dict[str, str]:
     """
     Generate an image from a text prompt using Replicate's Flux model.
@@ -182,6 +560,17 @@ def generate_image(
         download: If True, download the image to .images folder (default: True)
         output_dir: Optional directory to save image. If None, uses .images in project root.
         filename: Optional filename for saved image. If None, generates timestamp-based name.
+        initial_poll: Seconds to wait before the first status check (default: 0.25)
+        poll_interval: Maximum seconds between status checks (default: 2.0)
+        png_compress_level: PNG zlib level for downloaded images (default: 1, see download_image)
+        output_format: Format for downloaded images: "png" (default), "jpeg" or "webp"
+        background_download: If True, return as soon as the prediction finishes and
+                             download in a background thread; pass the results to
+                             wait_all() to fill in 'file_path'.
+        seed: Optional random seed. A seeded generation is deterministic, so it is
+              recorded in .images/cache.json and an identical later request reuses
+              the saved image (result has 'cached': True and no 'url') instead of
+              calling the API.
     
     Returns:
         Dictionary with 'url' (image URL) and optionally 'file_path' (if download=True)
@@ -193,28 +582,132 @@ def generate_image(
     """
     setup_replicate(api_key, config)
     
-    input_params = {
-        "prompt": prompt,
-        "num_inference_steps": num_inference_steps,
-        "guidance_scale": guidance_scale,
-        "model": model_type,
-    }
+    input_params = _build_input(prompt, num_inference_steps, guidance_scale, model_type, seed)
     
-    output = replicate.run(model, input=input_params)
+    # Seeded requests are deterministic: reuse a previously saved image
+    cache_key = _image_cache_key(model, input_params, output_format) if seed is not None and download else None
+    cached = _lookup_cached_image(cache_key, output_dir)
+    if cached:
+        return cached
+    
+    output = _run_prediction(model, input_params, initial_poll, poll_interval)
     generated_img_url = str(output[0])
     
-    result = {"url": generated_img_url}
+    return _finish_result(
+        generated_img_url, download, output_dir, filename,
+        png_compress_level, output_format, background_download, cache_key
+    )
+
+
+def generate_images_batch(
+    prompts: List[str],
+    model: str = "black-forest-labs/flux-dev",
+    num_inference_steps: int = 28,
+    guidance_scale: float = 7.5,
+    model_type: str = "dev",
+    api_key: Optional[str] = None,
+    config: Optional[Dict] = None,
+    concurrency: int = 4,
+    download: bool = True,
+    output_dir: Optional[Path] = None,
+    initial_poll: float = 0.25,
+    poll_interval: float = 2.0,
+    png_compress_level: int = 1,
+    output_format: Literal["png", "jpeg", "webp"] = "png",
+    seed: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """
+    Generate one image per prompt, running the predictions concurrently.
     
-    # Download image if requested
-    if download:
+    All predictions are dispatched through a single asyncio event loop, so the
+    server-side generation time of each prompt overlaps with the others instead
+    of being waited on serially.
+    
+    Args:
+        prompts: List of text prompts, one image per prompt
+        model: Model identifier (see generate_image)
+        num_inference_steps: Number of inference steps
+        guidance_scale: How much attention the model pays to the prompt
+        model_type: Type of model to use ("dev" or "schnell")
+        api_key: Optional Replicate API key. If None, uses config or environment variable.
+        config: Optional config dictionary. If provided, will use api_key from config.
+        concurrency: Maximum number of predictions in flight at once (default: 4)
+        download: If True, download the images to .images folder (default: True)
+        output_dir: Optional directory to save images. If None, uses .images in project root.
+        initial_poll: Seconds to wait before the first status check (default: 0.25)
+        poll_interval: Maximum seconds between status checks (default: 2.0)
+        png_compress_level: PNG zlib level for downloaded images (default: 1, see download_image)
+        output_format: Format for downloaded images: "png" (default), "jpeg" or "webp"
+        seed: Optional random seed used for every prompt. Seeded prompts that were
+              generated before are served from .images/cache.json (see generate_image).
+    
+    Returns:
+        List of result dictionaries in the same order as prompts. Each has 'url'
+        and optionally 'file_path'; a prompt whose prediction failed gets an
+        'error' entry instead of 'url'.
+    """
+    setup_replicate(api_key, config)
+    
+    if not prompts:
+        return []
+    
+    # One ns timestamp for the whole batch; the index keeps filenames unique
+    batch_ns = time.time_ns()
+    suffix = OUTPUT_SUFFIXES.get(output_format, ".png")
+    
+    async def _run_all():
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        loop = asyncio.get_running_loop()
+        # A client per batch, so its async HTTP pool lives and dies with this loop
+        client = replicate.Client(api_token=os.environ.get("REPLICATE_API_TOKEN"))
+        
+        async def _one(i: int, prompt: str):
+            input_params = _build_input(prompt, num_inference_steps, guidance_scale, model_type, seed)
+            cache_key = _image_cache_key(model, input_params, output_format) if seed is not None and download else None
+            cached = _lookup_cached_image(cache_key, output_dir)
+            if cached:
+                return cached
+            async with semaphore:
+                output = await _async_run_prediction(client, model, input_params, initial_poll, poll_interval)
+            # Download on the shared pool while the remaining predictions keep running
+            filename = f"img_{batch_ns:x}_{i + 1}{suffix}"
+            return await loop.run_in_executor(
+                _downloader,
+                functools.partial(
+                    _finish_result, str(output[0]), download, output_dir, filename,
+                    png_compress_level, output_format, cache_key=cache_key
+                )
+            )
+        
         try:
-            file_path = download_image(generated_img_url, output_dir, filename)
-            result["file_path"] = str(file_path)
-        except Exception as e:
-            print(f"Warning: Failed to download image: {e}")
-            print(f"Image URL: {generated_img_url}")
+            return await asyncio.gather(*[_one(i, p) for i, p in enumerate(prompts)], return_exceptions=True)
+        finally:
+            await client._async_client.aclose()
+    
+    results = []
+    for i, result in enumerate(asyncio.run(_run_all())):
+        if isinstance(result, Exception):
+            print(f"Warning: Image generation failed for prompt {i + 1}: {result}")
+            result = {"error": str(result)}
+        results.append(result)
+    
+    return results
+
+
+def _latest_version_id(model_owner: str, model_name: str) -> str:
+    """Resolve the id of a model's latest version, cached for VERSION_CACHE_TTL seconds."""
+    key = (model_owner, model_name)
+    now = time.monotonic()
+    with _version_cache_lock:
+        cached = _version_cache.get(key)
+    if cached and now - cached[0] < VERSION_CACHE_TTL:
+        return cached[1]
     
-    return result
+    model = replicate.models.get(owner=model_owner, name=model_name)
+    version_id = model.versions.list()[0].id
+    with _version_cache_lock:
+        _version_cache[key] = (now, version_id)
+    return version_id
 
 
 def generate_image_finetuned(
@@ -229,7 +722,13 @@ def generate_image_finetuned(
     config: Optional[Dict] = None,
     download: bool = True,
     output_dir: Optional[Path] = None,
-    filename: Optional[str] = None
+    filename: Optional[str] = None,
+    initial_poll: float = 0.25,
+    poll_interval: float = 2.0,
+    png_compress_level: int = 1,
+    output_format: Literal["png", "jpeg", "webp"] = "png",
+    background_download: bool = False,
+    seed: Optional[int] = None
 ) -> Dict[str, str]:
     """
     Generate an image using a fine-tuned model.
@@ -248,15 +747,26 @@ def generate_image_finetuned(
         download: If True, download the image to .images folder (default: True)
         output_dir: Optional directory to save image. If None, uses .images in project root.
         filename: Optional filename for saved image. If None, generates timestamp-based name.
+        initial_poll: Seconds to wait before the first status check (default: 0.25)
+        poll_interval: Maximum seconds between status checks (default: 2.0)
+        png_compress_level: PNG zlib level for downloaded images (default: 1, see download_image)
+        output_format: Format for downloaded images: "png" (default), "jpeg" or "webp"
+        background_download: If True, return as soon as the prediction finishes and
+                             download in a background thread; pass the results to
+                             wait_all() to fill in 'file_path'.
+        seed: Optional random seed. A seeded generation is deterministic, so it is
+              recorded in .images/cache.json and an identical later request reuses
+              the saved image (result has 'cached': True and no 'url') instead of
+              calling the API.
     
     Returns:
         Dictionary with 'url' (image URL) and optionally 'file_path' (if download=True)
     """
     setup_replicate(api_key, config)
     
-    # Get the latest version of the model
-    model = replicate.models.get(owner=model_owner, name=model_name)
-    latest_version = model.versions.list()[0]
+    # Resolve the latest version of the model (cached briefly per owner/name)
+    # in the background while the request is prepared
+    version_future = _lookup_pool.submit(_latest_version_id, model_owner, model_name)
     
     # Add trigger word if provided
     if trigger_word:
@@ -264,28 +774,23 @@ def generate_image_finetuned(
     else:
         full_prompt = prompt
     
-    input_params = {
-        "prompt": full_prompt,
-        "num_inference_steps": num_inference_steps,
-        "guidance_scale": guidance_scale,
-        "model": model_type,
-    }
+    input_params = _build_input(full_prompt, num_inference_steps, guidance_scale, model_type, seed)
     
-    output = replicate.run(latest_version, input=input_params)
-    generated_img_url = str(output[0])
+    latest_version = f"{model_owner}/{model_name}:{version_future.result()}"
     
-    result = {"url": generated_img_url}
+    # Seeded requests are deterministic: reuse a previously saved image
+    cache_key = _image_cache_key(latest_version, input_params, output_format) if seed is not None and download else None
+    cached = _lookup_cached_image(cache_key, output_dir)
+    if cached:
+        return cached
     
-    # Download image if requested
-    if download:
-        try:
-            file_path = download_image(generated_img_url, output_dir, filename)
-            result["file_path"] = str(file_path)
-        except Exception as e:
-            print(f"Warning: Failed to download image: {e}")
-            print(f"Image URL: {generated_img_url}")
+    output = _run_prediction(latest_version, input_params, initial_poll, poll_interval)
+    generated_img_url = str(output[0])
     
-    return result
+    return _finish_result(
+        generated_img_url, download, output_dir, filename,
+        png_compress_level, output_format, background_download, cache_key
+    )
 
 
 if __name__ == "__main__":
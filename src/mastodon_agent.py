@@ -6,18 +6,65 @@ This script allows you to post content from post_scripts folder to Mastodon.
 """
 
 import os
+import re
 import sys
 import json
+import mmap
+import time
+import errno
+import hashlib
+import heapq
+import inspect
+import asyncio
 import argparse
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict
 
+# Project root (parent of src), resolved once instead of on every load_config call
+_PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
+
+# orjson is optional; config files are small, but it also skips the text-mode layer
 try:
-    from mastodon import Mastodon
+    import orjson
+    
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 except ImportError:
-    print("Error: mastodon library not found. Install it with:")
-    print("  pip install Mastodon.py")
-    sys.exit(1)
+    orjson = None
+    
+    def _json_loads(data: bytes):
+        return json.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Successful credential checks are remembered here for VERIFY_CACHE_TTL seconds
+VERIFY_CACHE_DIR = Path.home() / ".cache" / "mastodon_agent"
+VERIFY_CACHE_TTL = 24 * 60 * 60
+
+# Post files larger than this are memory-mapped instead of read()
+MMAP_THRESHOLD = 4096
+
+# One line including its newline (the trailing empty match is skipped)
+_LINE_RE = re.compile(r'[^\n]*\n?')
+
+# Plain-ASCII status markers: every console codec can encode them
+_OK = '[OK]'
+_FAIL = '[FAIL]'
+_WARN = '[WARN]'
+_INFO = '[INFO]'
+
+# Default status length limit, used until the instance reports its own
+_MASTODON_MAX = 500
+# Content longer than this is offered as a thread; the gap to _MASTODON_MAX
+# leaves room for part numbering
+_MASTODON_THREAD_THRESHOLD = 450
+_THREAD_HEADROOM = _MASTODON_MAX - _MASTODON_THREAD_THRESHOLD
 
 
 class MastodonAgent:
@@ -25,7 +72,8 @@ class MastodonAgent:
     
     def __init__(self, instance_url: str, access_token: str, 
                  client_id: Optional[str] = None, 
-                 client_secret: Optional[str] = None):
+                 client_secret: Optional[str] = None,
+                 assume_yes: bool = False):
         """
         Initialize Mastodon client
         
@@ -34,30 +82,196 @@ class MastodonAgent:
             access_token: Your access token
             client_id: Optional client ID (for future use)
             client_secret: Optional client secret (for future use)
+            assume_yes: If True, answer yes to every confirmation prompt
+                        (non-interactive use, e.g. cron)
         """
+        # Imported here rather than at module level so that --help and
+        # --list-posts don't pay for loading Mastodon.py and its dependencies
+        try:
+            from mastodon import Mastodon
+        except ImportError:
+            print("Error: mastodon library not found. Install it with:")
+            print("  pip install Mastodon.py")
+            sys.exit(1)
+        
         self.instance_url = instance_url.rstrip('/')
+        self.assume_yes = assume_yes
+        self._token = access_token
+        # Replaced by the instance's configured limit in verify_credentials()
+        self.max_chars = _MASTODON_MAX
+        self._session = self._build_session()
         self.mastodon = Mastodon(
             access_token=access_token,
-            api_base_url=self.instance_url
+            api_base_url=self.instance_url,
+            session=self._session
         )
+        
+        # Work out once which optional search() arguments this Mastodon.py
+        # version accepts, instead of probing with TypeErrors on every search
+        search_params = inspect.signature(self.mastodon.search).parameters
+        self._search_type_kwarg = next(
+            (name for name in ('type', 'result_type') if name in search_params), None
+        )
+        self._search_has_limit = 'limit' in search_params
+    
+    @staticmethod
+    def _build_session() -> "requests.Session":
+        """
+        Build a keep-alive HTTP session for all API calls.
+        
+        Every call goes to the same instance, so pooling lets thread posts,
+        searches and replies reuse one TLS connection instead of handshaking
+        each time. Transient gateway errors on GETs are retried; POSTs are not,
+        so a status is never published twice. 429s are left to Mastodon.py,
+        which waits for the rate-limit reset itself.
+        """
+        # Mastodon.py depends on requests, so these are available whenever it is
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self._session.close()
     
-    def verify_credentials(self) -> bool:
-        """Verify that credentials are valid"""
+    def _verify_cache_path(self) -> Path:
+        """Per-token cache file; the name is a hash so the token itself is never written"""
+        key = hashlib.sha256(f"{self.instance_url}\n{self._token}".encode('utf-8')).hexdigest()[:16]
+        return VERIFY_CACHE_DIR / f"{key}.json"
+    
+    @property
+    def thread_threshold(self) -> int:
+        """Length above which content is split into a thread on this instance"""
+        return self.max_chars - _THREAD_HEADROOM
+    
+    def _fetch_max_chars(self) -> int:
+        """Read the status length limit from /api/v1/instance, falling back to the default"""
         try:
-            account = self.mastodon.account_verify_credentials()
-            print(f"✓ Connected as: @{account['username']}@{account['acct'].split('@')[-1] if '@' in account['acct'] else ''}")
+            instance = self.mastodon.instance()
+            return int(instance['configuration']['statuses']['max_characters'])
+        except Exception:
+            # Older servers don't report configuration.statuses
+            return _MASTODON_MAX
+    
+    def _confirm(self, prompt: str) -> bool:
+        """Ask a y/n question on stdin, or return True without asking when assume_yes is set"""
+        if self.assume_yes:
             return True
-        except Exception as e:
-            print(f"✗ Failed to verify credentials: {e}")
-            return False
+        return input(prompt).lower() == 'y'
+    
+    def verify_credentials(self, use_cache: bool = True) -> bool:
+        """
+        Verify that credentials are valid
+        
+        Also records the instance's status length limit in self.max_chars.
+        
+        Args:
+            use_cache: If True, skip the network check when these credentials
+                       were verified successfully within the last 24 hours
+        """
+        cache_path = self._verify_cache_path()
+        if use_cache:
+            try:
+                if cache_path.stat().st_mtime > time.time() - VERIFY_CACHE_TTL:
+                    with open(cache_path, 'r', encoding='utf-8') as f:
+                        account = json.load(f)
+                    self.max_chars = int(account.get('max_chars', _MASTODON_MAX))
+                    print(f"{_OK} Connected as: @{account['username']}@{account['acct'].split('@')[-1] if '@' in account['acct'] else ''} (cached)")
+                    return True
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        # The instance lookup doesn't depend on the account check, so both GETs
+        # run side by side over the pooled session instead of back to back
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            max_chars_future = executor.submit(self._fetch_max_chars)
+            try:
+                account = self.mastodon.account_verify_credentials()
+                print(f"{_OK} Connected as: @{account['username']}@{account['acct'].split('@')[-1] if '@' in account['acct'] else ''}")
+            except Exception as e:
+                print(f"{_FAIL} Failed to verify credentials: {e}")
+                return False
+            self.max_chars = max_chars_future.result()
+        
+        # Remember the successful check; a cache write failure is not an error
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'username': account['username'],
+                    'acct': account['acct'],
+                    'max_chars': self.max_chars,
+                    'ts': time.time()
+                }, f)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+        return True
+    
+    async def _startup(self, post_file: str, use_cache: bool = True):
+        """
+        Verify credentials and read the post file concurrently
+        
+        The network round-trip and the disk read are independent, so running
+        them in worker threads side by side shaves the read off CLI startup.
+        
+        Returns:
+            (verified, content) where content is the raised exception if the
+            file could not be read
+        """
+        loop = asyncio.get_running_loop()
+        verified, content = await asyncio.gather(
+            loop.run_in_executor(None, self.verify_credentials, use_cache),
+            loop.run_in_executor(None, self.read_post_file, post_file),
+            return_exceptions=True
+        )
+        return verified is True, content
     
     def read_post_file(self, file_path: str) -> str:
         """Read content from a markdown post file"""
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Post file not found: {file_path}")
+        # Single open/fstat/read instead of Path.read_text's buffered text stack
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                raise FileNotFoundError(f"Post file not found: {file_path}") from None
+            raise
+        try:
+            size = os.fstat(fd).st_size
+            if size > MMAP_THRESHOLD:
+                # Thread-sized posts: let the kernel page the file in on demand
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[:]
+            else:
+                data = os.read(fd, size)
+                # Short reads are rare for regular files but possible; finish the file
+                while len(data) < size:
+                    chunk = os.read(fd, size - len(data))
+                    if not chunk:
+                        break
+                    data += chunk
+        finally:
+            os.close(fd)
         
-        content = path.read_text(encoding='utf-8').strip()
+        content = data.decode('utf-8')
+        # Match text-mode universal newlines for files saved with CRLF
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        content = content.strip()
         
         # Remove markdown formatting that might not work well on Mastodon
         # Keep basic formatting but clean up
@@ -79,10 +293,10 @@ class MastodonAgent:
                 media_file=file_path,
                 description=description or ""
             )
-            print(f"✓ Uploaded media: {file_path}")
+            print(f"{_OK} Uploaded media: {file_path}")
             return media
         except Exception as e:
-            print(f"✗ Failed to upload media: {e}")
+            print(f"{_FAIL} Failed to upload media: {e}")
             return None
     
     def post_status(self, content: str, visibility: str = 'public', 
@@ -92,7 +306,7 @@ class MastodonAgent:
         Post a status to Mastodon
         
         Args:
-            content: The status content (max 500 characters for most instances)
+            content: The status content (max self.max_chars characters, 500 on most instances)
             visibility: 'public', 'unlisted', 'private', or 'direct'
             spoiler_text: Optional content warning text
             media_ids: Optional list of media attachment IDs (from upload_media)
@@ -101,13 +315,12 @@ class MastodonAgent:
             The created status dict
         """
         # Mastodon character limit is typically 500, but can vary
-        max_length = 500
+        max_length = self.max_chars
         
         if len(content) > max_length:
-            print(f"⚠ Warning: Content is {len(content)} characters, max is {max_length}")
+            print(f"{_WARN} Warning: Content is {len(content)} characters, max is {max_length}")
             print("Content will be truncated or you may need to split into a thread.")
-            response = input("Continue anyway? (y/n): ")
-            if response.lower() != 'y':
+            if not self._confirm("Continue anyway? (y/n): "):
                 return None
         
         try:
@@ -117,37 +330,11 @@ class MastodonAgent:
                 spoiler_text=spoiler_text,
                 media_ids=media_ids
             )
-            print(f"✓ Posted successfully! Status ID: {status['id']}")
+            print(f"{_OK} Posted successfully! Status ID: {status['id']}")
             print(f"  URL: {status['url']}")
             return status
         except Exception as e:
-            print(f"✗ Failed to post: {e}")
-            return None
-    
-    def reply_to_status(self, status_id: int, content: str, 
-                       visibility: str = 'public') -> Optional[dict]:
-        """
-        Reply to a status on Mastodon
-        
-        Args:
-            status_id: ID of the status to reply to
-            content: Reply content
-            visibility: 'public', 'unlisted', 'private', or 'direct'
-        
-        Returns:
-            The created reply status dict, or None if failed
-        """
-        try:
-            reply = self.mastodon.status_post(
-                content,
-                in_reply_to_id=status_id,
-                visibility=visibility
-            )
-            print(f"✓ Replied successfully! Reply ID: {reply['id']}")
-            print(f"  URL: {reply['url']}")
-            return reply
-        except Exception as e:
-            print(f"✗ Failed to reply: {e}")
+            print(f"{_FAIL} Failed to post: {e}")
             return None
     
     def post_thread(self, posts: list, visibility: str = 'public') -> list:
@@ -163,9 +350,13 @@ class MastodonAgent:
         """
         statuses = []
         in_reply_to_id = None
+        total = len(posts)
+        # Bind once instead of looking the methods up on every part
+        post = self.mastodon.status_post
+        append = statuses.append
         
         for i, post_content in enumerate(posts, 1):
-            print(f"\nPosting thread part {i}/{len(posts)}...")
+            print(f"\nPosting thread part {i}/{total}...")
             
             # Add thread indicator if not first post
             if in_reply_to_id:
@@ -174,46 +365,57 @@ class MastodonAgent:
                 pass
             
             try:
-                status = self.mastodon.status_post(
+                status = post(
                     post_content,
                     visibility=visibility,
                     in_reply_to_id=in_reply_to_id
                 )
-                statuses.append(status)
+                append(status)
                 in_reply_to_id = status['id']
-                print(f"✓ Posted part {i}")
+                print(f"{_OK} Posted part {i}")
             except Exception as e:
-                print(f"✗ Failed to post part {i}: {e}")
+                print(f"{_FAIL} Failed to post part {i}: {e}")
                 break
         
         return statuses
     
-    def split_thread_content(self, content: str, max_length: int = 450) -> list:
+    def split_thread_content(self, content: str, max_length: Optional[int] = None) -> list:
         """
         Split long content into thread parts
         
         Args:
             content: The content to split
-            max_length: Max characters per part (leaving room for numbering)
+            max_length: Max characters per part (default: self.thread_threshold,
+                        leaving room for numbering)
         
         Returns:
             List of content parts
         """
+        if max_length is None:
+            max_length = self.thread_threshold
         # Split by lines first, then by sentences if needed
-        lines = content.split('\n')
         parts = []
-        current_part = ""
+        # Walk line spans and slice each part out of content once, instead of
+        # building a list of every line and re-joining it
+        part_start = 0
+        part_len = 0
         
-        for line in lines:
+        for m in _LINE_RE.finditer(content):
+            start, end = m.span()
+            if start == end:
+                continue
+            # Count the newline even on the last line, as a joined part would
+            add = end - start if content[end - 1] == '\n' else end - start + 1
             # If adding this line would exceed limit, start new part
-            if len(current_part) + len(line) + 1 > max_length and current_part:
-                parts.append(current_part.strip())
-                current_part = line + "\n"
+            if part_len + add > max_length and part_len:
+                parts.append(content[part_start:start].strip())
+                part_start, part_len = start, add
             else:
-                current_part += line + "\n"
+                part_len += add
         
-        if current_part.strip():
-            parts.append(current_part.strip())
+        last_part = content[part_start:].strip()
+        if last_part:
+            parts.append(last_part)
         
         return parts
     
@@ -229,47 +431,36 @@ class MastodonAgent:
             List of post dictionaries
         """
         try:
-            # Search for posts using Mastodon search API
-            # Try different parameter combinations based on Mastodon.py version
-            try:
-                # Try with type and limit parameters (newer versions)
-                results = self.mastodon.search(q=query, type='statuses', limit=limit * 2)
-            except (TypeError, KeyError) as e:
-                # If type parameter not supported, try without it
-                try:
-                    results = self.mastodon.search(q=query, limit=limit * 2)
-                except TypeError:
-                    # If limit also not supported, use minimal parameters
-                    results = self.mastodon.search(q=query)
+            # Search for posts using Mastodon search API, passing only the
+            # optional parameters this Mastodon.py version supports
+            search_kwargs = {'q': query}
+            if self._search_type_kwarg:
+                search_kwargs[self._search_type_kwarg] = 'statuses'
+            if self._search_has_limit:
+                search_kwargs['limit'] = limit * 2
+            results = self.mastodon.search(**search_kwargs)
             
             # Handle both dict and AttribAccessDict return types
-            if hasattr(results, 'statuses'):
-                statuses = results.statuses
-            elif hasattr(results, 'get'):
-                statuses = results.get('statuses', [])
-            else:
-                statuses = []
+            statuses = getattr(results, 'statuses', None)
+            if statuses is None:
+                statuses = results.get('statuses', []) if isinstance(results, dict) else []
             
             if not statuses:
-                print(f"ℹ No posts found for query: {query}")
+                print(f"{_INFO} No posts found for query: {query}")
                 return []
             
             # Filter to get most recent posts
-            # Remove duplicates and sort by creation time
+            # Remove duplicates (set.add returns None, so first occurrences pass)
             seen_ids = set()
-            unique_statuses = []
-            for status in statuses:
-                if status['id'] not in seen_ids:
-                    seen_ids.add(status['id'])
-                    unique_statuses.append(status)
-            
-            # Sort by creation time (most recent first)
-            unique_statuses.sort(key=lambda x: x['created_at'], reverse=True)
+            unique_statuses = [
+                s for s in statuses
+                if not (s['id'] in seen_ids or seen_ids.add(s['id']))
+            ]
             
-            # Return top limit posts
-            return unique_statuses[:limit]
+            # Return the top limit posts by creation time (most recent first)
+            return heapq.nlargest(limit, unique_statuses, key=itemgetter('created_at'))
         except Exception as e:
-            print(f"✗ Failed to search posts: {e}")
+            print(f"{_FAIL} Failed to search posts: {e}")
             return []
     
     def reply_to_status(self, status_id: int, content: str, 
@@ -279,19 +470,24 @@ class MastodonAgent:
         
         Args:
             status_id: ID of the status to reply to
-            content: Reply content (max 500 characters)
+            content: Reply content (max self.max_chars characters)
             visibility: 'public', 'unlisted', 'private', or 'direct'
         
         Returns:
             The created reply status dict, or None if failed
         """
         # Mastodon character limit is typically 500
-        max_length = 500
+        max_length = self.max_chars
         
         if len(content) > max_length:
-            print(f"⚠ Warning: Reply content is {len(content)} characters, max is {max_length}")
-            # Truncate at word boundary
-            content = content[:max_length].rsplit(' ', 1)[0] + '...'
+            print(f"{_WARN} Warning: Reply content is {len(content)} characters, max is {max_length}")
+            # Truncate at a word boundary, leaving room for "..." within the limit.
+            # The space search is bounded to the last 64 chars before the cut.
+            cut = max_length - 3
+            space = content.rfind(' ', max(0, cut - 64), cut)
+            if space <= 0:
+                space = cut
+            content = content[:space] + '...'
         
         try:
             reply = self.mastodon.status_post(
@@ -299,34 +495,31 @@ class MastodonAgent:
                 in_reply_to_id=status_id,
                 visibility=visibility
             )
-            print(f"✓ Replied successfully! Reply ID: {reply['id']}")
+            print(f"{_OK} Replied successfully! Reply ID: {reply['id']}")
             print(f"  URL: {reply['url']}")
             return reply
         except Exception as e:
-            print(f"✗ Failed to reply: {e}")
+            print(f"{_FAIL} Failed to reply: {e}")
             return None
 
 
 def load_config(config_path: str = ".config/mastodon_config.json") -> dict:
     """Load Mastodon configuration from JSON file"""
     # Resolve relative to project root (parent of src)
-    if not Path(config_path).is_absolute():
-        project_root = Path(__file__).resolve().parent.parent
-        config_file = project_root / config_path
-    else:
-        config_file = Path(config_path)
+    config_file = Path(config_path)
+    if not config_file.is_absolute():
+        config_file = _PROJECT_ROOT / config_file
     
-    if config_file.exists():
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    try:
+        return _json_loads(config_file.read_bytes())
+    except FileNotFoundError:
+        return {}
 
 
 def save_config(config: dict, config_path: str = "mastodon_config.json"):
     """Save Mastodon configuration to JSON file"""
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
-    print(f"✓ Configuration saved to {config_path}")
+    Path(config_path).write_bytes(_json_dumps(config))
+    print(f"{_OK} Configuration saved to {config_path}")
 
 
 def main():
@@ -376,9 +569,24 @@ def main():
         action='store_true',
         help='Post as thread if content is long'
     )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Answer yes to all confirmation prompts (non-interactive mode)'
+    )
+    parser.add_argument(
+        '--no-verify-cache',
+        action='store_true',
+        help='Always verify credentials with the server (ignore the 24h cache)'
+    )
     
     args = parser.parse_args()
     
+    # Listing is local-only: no credentials needed and no Mastodon.py import
+    if args.list_posts:
+        list_post_files()
+        return
+    
     # Load config
     config = load_config(args.config)
     
@@ -407,26 +615,48 @@ def main():
         instance_url=instance_url,
         access_token=access_token,
         client_id=config.get('client_id'),
-        client_secret=config.get('client_secret')
+        client_secret=config.get('client_secret'),
+        assume_yes=args.yes
     )
+    try:
+        run_agent(agent, args)
+    finally:
+        agent.close()
+
+
+def list_post_files(post_scripts_dir: str = "post_scripts"):
+    """Print the markdown post files available in post_scripts_dir"""
+    try:
+        # Same matches as Path.glob("*.md") (dotfiles and directories included),
+        # without building a Path object per entry
+        with os.scandir(post_scripts_dir) as entries:
+            names = sorted(entry.name for entry in entries if entry.name.endswith('.md'))
+    except NotADirectoryError:
+        names = []
+    except FileNotFoundError:
+        print("post_scripts directory not found")
+        return
     
-    # Verify credentials
-    if not agent.verify_credentials():
+    print("\nAvailable post files:")
+    for name in names:
+        print(f"  - {os.path.join(post_scripts_dir, name)}")
+
+
+def run_agent(agent: MastodonAgent, args: argparse.Namespace):
+    """Run the requested CLI action with an initialized agent"""
+    # Verify credentials, reading the post file at the same time when one will be posted
+    # An explicit --verify always asks the server
+    use_cache = not (args.no_verify_cache or args.verify)
+    content = None
+    if args.post_file and not args.verify:
+        verified, content = asyncio.run(agent._startup(args.post_file, use_cache))
+    else:
+        verified = agent.verify_credentials(use_cache)
+    if not verified:
         sys.exit(1)
     
     if args.verify:
-        print("✓ Credentials verified successfully!")
-        return
-    
-    # List available posts
-    if args.list_posts:
-        post_scripts_dir = Path("post_scripts")
-        if post_scripts_dir.exists():
-            print("\nAvailable post files:")
-            for post_file in sorted(post_scripts_dir.glob("*.md")):
-                print(f"  - {post_file}")
-        else:
-            print("post_scripts directory not found")
+        print(f"{_OK} Credentials verified successfully!")
         return
     
     # Post content
@@ -436,25 +666,30 @@ def main():
         sys.exit(1)
     
     try:
-        content = agent.read_post_file(args.post_file)
-        print(f"\nContent to post ({len(content)} characters):")
+        if isinstance(content, Exception):
+            raise content
+        content_len = len(content)
+        print(f"\nContent to post ({content_len} characters):")
         print("-" * 50)
-        print(content[:200] + "..." if len(content) > 200 else content)
+        # Write the truncated preview in two pieces rather than building prefix + "..."
+        if content_len > 200:
+            sys.stdout.write(content[:200])
+            sys.stdout.write("...\n")
+        else:
+            print(content)
         print("-" * 50)
         
         # Check if we should post as thread
-        if args.thread or len(content) > 450:
+        if args.thread or len(content) > agent.thread_threshold:
             parts = agent.split_thread_content(content)
             if len(parts) > 1:
                 print(f"\nContent will be split into {len(parts)} parts")
-                response = input("Post as thread? (y/n): ")
-                if response.lower() == 'y':
+                if agent._confirm("Post as thread? (y/n): "):
                     agent.post_thread(parts, visibility=args.visibility)
                     return
         
         # Post single status
-        response = input("\nPost this content? (y/n): ")
-        if response.lower() == 'y':
+        if agent._confirm("\nPost this content? (y/n): "):
             agent.post_status(
                 content,
                 visibility=args.visibility,
@@ -5,21 +5,232 @@ Notion API Agent for DailyTopArxiv
 This script allows you to upload content from markdown files to Notion pages.
 """
 
+import io
 import os
+import re
 import sys
 import json
+import mmap
+import time
 import argparse
+import functools
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, Future
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterable, Iterator
 
 try:
-    from notion_client import Client
+    from notion_client import Client, APIResponseError
 except ImportError:
     print("Error: notion-client library not found. Install it with:")
     print("  uv sync")
     print("  or: pip install notion-client")
     sys.exit(1)
 
+# Project root (parent of src), resolved once instead of on every load_config call
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# orjson is optional; when present it encodes config files and request
+# bodies, which for create/append carry every converted block
+try:
+    import orjson
+    import httpx
+    
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    class _OrjsonHTTPClient(httpx.Client):
+        """httpx client (as used by notion-client) that encodes JSON bodies with orjson"""
+        
+        def build_request(self, method, url, *, json=None, content=None, headers=None, **kwargs):
+            if json is not None and content is None:
+                content = orjson.dumps(json)
+                headers = httpx.Headers(headers)
+                headers["Content-Type"] = "application/json"
+            return super().build_request(method, url, content=content, headers=headers, **kwargs)
+except ImportError:
+    orjson = None
+    _OrjsonHTTPClient = None
+    
+    def _json_loads(data: bytes):
+        return json.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# One notion Client per API token, shared by every NotionAgent in the process
+# so they reuse a single keep-alive connection pool
+_CLIENT_CACHE: Dict[str, Client] = {}
+
+# Notion accepts at most this many children per append/create request
+NOTION_MAX_CHILDREN = 100
+# Concurrent block deletes when replacing page content (Notion allows ~3 req/s)
+DELETE_WORKERS = 3
+# Attempts per block delete when Notion answers rate_limited
+DELETE_ATTEMPTS = 5
+# Markdown files larger than this are decoded straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Markdown line patterns, matched against stripped lines
+_HEADING_RE = re.compile(r'(#{1,3}) (.*)')
+_BULLET_RE = re.compile(r'[-*] (.*)')
+_NUMBERED_RE = re.compile(r'\d{1,3}\. (.*)')
+
+# Deletes the '*' and '`' of simple bold/italic/code markup in one pass
+_STRIP_MD = str.maketrans('', '', '*`')
+
+# Page IDs: separators to drop, then the 8-4-4-4-12 groups of a 32-char ID
+_PAGE_ID_SEPARATORS_RE = re.compile(r'[-\s]')
+_PAGE_ID_GROUPS_RE = re.compile(r'(.{8})(.{4})(.{4})(.{4})(.{12})')
+
+# Heading level (number of '#') -> Notion block type
+_HEADING_TYPES = {1: "heading_1", 2: "heading_2", 3: "heading_3"}
+
+# Notion caps each rich_text content string at this many characters
+NOTION_MAX_TEXT = 2000
+
+# Code fence info strings -> Notion code block languages (Notion rejects
+# languages outside its fixed list, so anything unknown becomes plain text)
+_CODE_LANGUAGE_ALIASES = {
+    "py": "python", "python": "python",
+    "js": "javascript", "javascript": "javascript",
+    "ts": "typescript", "typescript": "typescript",
+    "sh": "shell", "shell": "shell", "bash": "bash", "zsh": "shell",
+    "json": "json", "yaml": "yaml", "yml": "yaml",
+    "md": "markdown", "markdown": "markdown", "html": "html", "css": "css",
+    "sql": "sql", "c": "c", "cpp": "c++", "c++": "c++", "java": "java",
+    "go": "go", "rust": "rust", "latex": "latex", "tex": "latex",
+}
+
+# Markdown prefix emitted for each block type when converting back to text
+_BLOCK_PREFIX = {
+    "heading_1": "# ",
+    "heading_2": "## ",
+    "heading_3": "### ",
+    "bulleted_list_item": "- ",
+    "numbered_list_item": "1. ",
+}
+
+
+def _make_block(block_type: str, content: str) -> Dict:
+    """Build a Notion text block of the given type"""
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {"rich_text": [{"type": "text", "text": {"content": content}}]}
+    }
+
+
+def _paragraph_block(line: str) -> Optional[Dict]:
+    """Plain paragraph, with simple markdown formatting removed"""
+    text = line.translate(_STRIP_MD)
+    if not text:
+        return None
+    return _make_block("paragraph", text)
+
+
+def _heading_block(line: str) -> Optional[Dict]:
+    """# / ## / ### headers; deeper or malformed headers become paragraphs"""
+    m = _HEADING_RE.match(line)
+    if not m:
+        return _paragraph_block(line)
+    return _make_block(_HEADING_TYPES[len(m.group(1))], m.group(2).strip())
+
+
+def _bullet_block(line: str) -> Optional[Dict]:
+    """- item / * item"""
+    m = _BULLET_RE.match(line)
+    if not m:
+        return _paragraph_block(line)
+    return _make_block("bulleted_list_item", m.group(1).strip())
+
+
+def _numbered_block(line: str) -> Optional[Dict]:
+    """1. item"""
+    m = _NUMBERED_RE.match(line)
+    if not m:
+        return _paragraph_block(line)
+    return _make_block("numbered_list_item", m.group(1).strip())
+
+
+def _code_block(code_lines: List[str], language: str) -> Dict:
+    """A fenced code block, split into rich_text pieces Notion will accept"""
+    code = "\n".join(code_lines)
+    return {
+        "object": "block",
+        "type": "code",
+        "code": {
+            "rich_text": [
+                {"type": "text", "text": {"content": code[i:i + NOTION_MAX_TEXT]}}
+                for i in range(0, len(code), NOTION_MAX_TEXT)
+            ],
+            "language": _CODE_LANGUAGE_ALIASES.get(language.lower(), "plain text")
+        }
+    }
+
+
+# Block builder by first character of the line; anything else is a paragraph
+_LINE_DISPATCH = {
+    '#': _heading_block,
+    '-': _bullet_block,
+    '*': _bullet_block,
+    **{digit: _numbered_block for digit in '0123456789'},
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _format_page_id(page_id: str) -> str:
+    """Hyphenate a 32-character page ID; cached since the same IDs recur all session"""
+    # Remove any existing hyphens and whitespace
+    clean_id = _PAGE_ID_SEPARATORS_RE.sub('', page_id)
+    
+    # Add hyphens in the correct positions
+    m = _PAGE_ID_GROUPS_RE.fullmatch(clean_id)
+    if m:
+        return '-'.join(m.groups())
+    return page_id  # Return as-is if not 32 chars
+
+
+def _iter_blocks(markdown: str) -> Iterator[Dict]:
+    """Yield Notion blocks line by line, without materializing a list of lines"""
+    dispatch = _LINE_DISPATCH.get
+    # Inside a ``` fence lines are collected verbatim until the closing fence
+    in_code = False
+    language = ""
+    code_lines = []
+    
+    for raw_line in io.StringIO(markdown):
+        line = raw_line.strip()
+        if in_code:
+            if line.startswith('```'):
+                yield _code_block(code_lines, language)
+                in_code = False
+            else:
+                code_lines.append(raw_line.rstrip('\r\n'))
+            continue
+        
+        if not line:
+            continue
+        
+        if line[0] == '`' and line.startswith('```'):
+            in_code = True
+            language = line[3:].strip()
+            code_lines = []
+            continue
+        
+        # One table lookup on the first character picks the block type
+        block = dispatch(line[0], _paragraph_block)(line)
+        if block is not None:
+            yield block
+    
+    # An unterminated fence still keeps its code
+    if in_code:
+        yield _code_block(code_lines, language)
+
 
 class NotionAgent:
     """Agent for interacting with Notion API"""
@@ -28,10 +239,16 @@ class NotionAgent:
         """
         Initialize Notion client
         
+        Agents created with the same token share one underlying client.
+        
         Args:
             api_token: Your Notion integration token
         """
-        self.client = Client(auth=api_token)
+        client = _CLIENT_CACHE.get(api_token)
+        if client is None:
+            http_client = _OrjsonHTTPClient() if _OrjsonHTTPClient is not None else None
+            client = _CLIENT_CACHE.setdefault(api_token, Client(auth=api_token, client=http_client))
+        self.client = client
     
     def verify_credentials(self, test_page_id: Optional[str] = None) -> bool:
         """
@@ -40,6 +257,19 @@ class NotionAgent:
         Args:
             test_page_id: Optional page ID to test access to
         """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The page check doesn't depend on the token check, so start it
+            # first and let both requests run at the same time
+            page_future = None
+            if test_page_id:
+                # Format page ID (remove hyphens if present, then add them back in correct format)
+                formatted_id = self.format_page_id(test_page_id)
+                page_future = executor.submit(self.client.pages.retrieve, page_id=formatted_id)
+            
+            return self._report_credentials(test_page_id, page_future)
+    
+    def _report_credentials(self, test_page_id: Optional[str], page_future: Optional[Future]) -> bool:
+        """Check the token, then report the result of the in-flight page lookup"""
         try:
             # Try to list users to verify token
             users = self.client.users.list()
@@ -49,12 +279,10 @@ class NotionAgent:
                 print(f"  User: {user.get('name', 'Unknown')}")
             
             # Test page access if provided
-            if test_page_id:
+            if page_future is not None:
                 print(f"\nTesting access to page: {test_page_id}")
                 try:
-                    # Format page ID (remove hyphens if present, then add them back in correct format)
-                    formatted_id = self.format_page_id(test_page_id)
-                    page = self.client.pages.retrieve(page_id=formatted_id)
+                    page = page_future.result()
                     print(f"✓ Page accessible!")
                     print(f"  Title: {self.get_page_title(page)}")
                     print(f"  URL: {page.get('url', 'N/A')}")
@@ -79,31 +307,41 @@ class NotionAgent:
         
         Notion page IDs should be in format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
         """
-        # Remove any existing hyphens and whitespace
-        clean_id = page_id.replace('-', '').replace(' ', '')
-        
-        # Add hyphens in the correct positions
-        if len(clean_id) == 32:
-            return f"{clean_id[:8]}-{clean_id[8:12]}-{clean_id[12:16]}-{clean_id[16:20]}-{clean_id[20:]}"
-        return page_id  # Return as-is if not 32 chars
+        return _format_page_id(page_id)
     
     def get_page_title(self, page: Dict) -> str:
         """Extract page title from Notion page object"""
-        props = page.get('properties', {})
-        for prop_name, prop_value in props.items():
-            if prop_value.get('type') == 'title':
-                title_array = prop_value.get('title', [])
-                if title_array:
-                    return title_array[0].get('plain_text', 'Untitled')
-        return 'Untitled'
+        # First non-empty title property; values() skips the unused names
+        return next(
+            (
+                prop['title'][0].get('plain_text', 'Untitled')
+                for prop in page.get('properties', {}).values()
+                if prop.get('type') == 'title' and prop.get('title')
+            ),
+            'Untitled'
+        )
     
     def read_markdown_file(self, file_path: str) -> str:
         """Read content from a markdown file"""
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        try:
+            if os.fstat(fd).st_size > MMAP_THRESHOLD:
+                # Decode from the mapping itself, skipping the intermediate bytes copy
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, 'utf-8')
+            else:
+                with os.fdopen(fd, 'rb', closefd=False) as f:
+                    content = f.read().decode('utf-8')
+        finally:
+            os.close(fd)
         
-        return path.read_text(encoding='utf-8').strip()
+        # Match read_text's universal newlines for files saved with CRLF
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content.strip()
     
     def markdown_to_notion_blocks(self, markdown: str) -> List[Dict]:
         """
@@ -112,76 +350,7 @@ class NotionAgent:
         This is a simple converter. For more complex markdown, consider using
         a library like markdown-to-notion or md2notion.
         """
-        blocks = []
-        lines = markdown.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Headers
-            if line.startswith('# '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_1",
-                    "heading_1": {
-                        "rich_text": [{"type": "text", "text": {"content": line[2:].strip()}}]
-                    }
-                })
-            elif line.startswith('## '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_2",
-                    "heading_2": {
-                        "rich_text": [{"type": "text", "text": {"content": line[3:].strip()}}]
-                    }
-                })
-            elif line.startswith('### '):
-                blocks.append({
-                    "object": "block",
-                    "type": "heading_3",
-                    "heading_3": {
-                        "rich_text": [{"type": "text", "text": {"content": line[4:].strip()}}]
-                    }
-                })
-            # Bullet lists
-            elif line.startswith('- ') or line.startswith('* '):
-                blocks.append({
-                    "object": "block",
-                    "type": "bulleted_list_item",
-                    "bulleted_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": line[2:].strip()}}]
-                    }
-                })
-            # Numbered lists
-            elif line[0].isdigit() and '. ' in line[:5]:
-                content = line.split('. ', 1)[1] if '. ' in line else line
-                blocks.append({
-                    "object": "block",
-                    "type": "numbered_list_item",
-                    "numbered_list_item": {
-                        "rich_text": [{"type": "text", "text": {"content": content.strip()}}]
-                    }
-                })
-            # Code blocks
-            elif line.startswith('```'):
-                # Skip code block markers for now (would need multi-line handling)
-                continue
-            # Regular paragraphs
-            else:
-                # Remove markdown formatting for simple text
-                text = line.replace('**', '').replace('*', '').replace('`', '')
-                if text:
-                    blocks.append({
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{"type": "text", "text": {"content": text}}]
-                        }
-                    })
-        
-        return blocks
+        return list(_iter_blocks(markdown))
     
     def create_page(self, parent_id: str, title: str, content: str) -> Dict:
         """
@@ -199,8 +368,10 @@ class NotionAgent:
             # Format the parent ID
             formatted_parent_id = self.format_page_id(parent_id)
             
-            # Convert markdown to blocks
-            blocks = self.markdown_to_notion_blocks(content)
+            # Convert markdown to blocks; the page is created with the first
+            # NOTION_MAX_CHILDREN (the most pages.create accepts)
+            blocks = _iter_blocks(content)
+            first_blocks = list(islice(blocks, NOTION_MAX_CHILDREN))
             
             # Create the page
             page = self.client.pages.create(
@@ -216,9 +387,13 @@ class NotionAgent:
                         ]
                     }
                 },
-                children=blocks
+                children=first_blocks
             )
             
+            # Append the remainder in order, one request per chunk (children
+            # must arrive sequentially or Notion would interleave them)
+            self._append_blocks(page["id"], blocks)
+            
             print(f"✓ Created page: {title}")
             print(f"  URL: {page.get('url', 'N/A')}")
             return page
@@ -237,12 +412,9 @@ class NotionAgent:
         try:
             # Format the page ID
             formatted_page_id = self.format_page_id(page_id)
-            blocks = self.markdown_to_notion_blocks(content)
             
-            self.client.blocks.children.append(
-                block_id=formatted_page_id,
-                children=blocks
-            )
+            # Blocks are generated lazily, one request's worth at a time
+            self._append_blocks(formatted_page_id, _iter_blocks(content))
             
             print(f"✓ Appended content to page")
             return True
@@ -250,6 +422,36 @@ class NotionAgent:
             print(f"✗ Failed to append content: {e}")
             return False
     
+    def _append_blocks(self, block_id: str, blocks: Iterable[Dict]):
+        """Append blocks in order, NOTION_MAX_CHILDREN per request"""
+        blocks = iter(blocks)
+        while True:
+            chunk = list(islice(blocks, NOTION_MAX_CHILDREN))
+            if not chunk:
+                break
+            self.client.blocks.children.append(block_id=block_id, children=chunk)
+    
+    def _delete_block(self, block_id: str) -> bool:
+        """Delete one block, backing off on rate limits. Returns True on success"""
+        for attempt in range(DELETE_ATTEMPTS):
+            try:
+                self.client.blocks.delete(block_id=block_id)
+                return True
+            except APIResponseError as e:
+                if e.code != "rate_limited" or attempt == DELETE_ATTEMPTS - 1:
+                    print(f"  ✗ Could not delete block {block_id}: {e}")
+                    return False
+                headers = getattr(e, "headers", None) or {}
+                try:
+                    delay = float(headers.get("retry-after", ""))
+                except ValueError:
+                    delay = 2 ** attempt
+                time.sleep(delay)
+            except Exception as e:
+                print(f"  ✗ Could not delete block {block_id}: {e}")
+                return False
+        return False
+    
     def fetch_page_content(self, page_id: str) -> Optional[str]:
         """
         Fetch content from a Notion page and convert to plain text
@@ -262,55 +464,50 @@ class NotionAgent:
         """
         try:
             formatted_page_id = self.format_page_id(page_id)
-            
-            # Get page info
-            page = self.client.pages.retrieve(page_id=formatted_page_id)
-            
-            # Get all blocks (handle pagination)
-            all_blocks = []
-            cursor = None
-            
-            while True:
-                response = self.client.blocks.children.list(
-                    block_id=formatted_page_id,
-                    start_cursor=cursor
-                )
-                all_blocks.extend(response.get("results", []))
-                cursor = response.get("next_cursor")
-                if not cursor:
-                    break
-            
-            # Convert blocks to text
             content_parts = []
             
-            for block in all_blocks:
-                block_type = block.get("type")
-                block_content = block.get(block_type, {})
-                rich_text = block_content.get("rich_text", [])
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Get page info alongside the block listing; it only checks access
+                page_future = executor.submit(self.client.pages.retrieve, page_id=formatted_page_id)
                 
-                if rich_text:
-                    # Extract text from rich_text array
-                    text_content = "".join([rt.get("plain_text", "") for rt in rich_text])
-                    if text_content:
-                        # Add appropriate markdown formatting based on block type
-                        if block_type == "heading_1":
-                            content_parts.append(f"# {text_content}\n")
-                        elif block_type == "heading_2":
-                            content_parts.append(f"## {text_content}\n")
-                        elif block_type == "heading_3":
-                            content_parts.append(f"### {text_content}\n")
-                        elif block_type == "bulleted_list_item":
-                            content_parts.append(f"- {text_content}\n")
-                        elif block_type == "numbered_list_item":
-                            content_parts.append(f"1. {text_content}\n")
-                        else:
-                            content_parts.append(f"{text_content}\n")
+                # Get all blocks (handle pagination). Each request needs the
+                # previous page's cursor, so pages are fetched one at a time
+                cursor = None
+                while True:
+                    response = self.client.blocks.children.list(
+                        block_id=formatted_page_id,
+                        start_cursor=cursor
+                    )
+                    self._blocks_to_text(response.get("results", []), content_parts)
+                    cursor = response.get("next_cursor")
+                    if not cursor:
+                        break
+                
+                page_future.result()
             
             return "".join(content_parts).strip()
         except Exception as e:
             print(f"✗ Failed to fetch page content: {e}")
             return None
     
+    @staticmethod
+    def _blocks_to_text(blocks: List[Dict], content_parts: List[str]):
+        """Convert blocks to markdown-ish text lines, appended to content_parts"""
+        append = content_parts.append
+        prefix_for = _BLOCK_PREFIX.get
+        
+        for block in blocks:
+            block_type = block.get("type")
+            block_content = block.get(block_type, {})
+            rich_text = block_content.get("rich_text", [])
+            
+            if rich_text:
+                # Extract text from rich_text array
+                text_content = "".join([rt.get("plain_text", "") for rt in rich_text])
+                if text_content:
+                    # Add appropriate markdown formatting based on block type
+                    append(prefix_for(block_type, "") + text_content + "\n")
+    
     def update_page(self, page_id: str, title: Optional[str] = None, content: Optional[str] = None) -> bool:
         """
         Update an existing Notion page
@@ -343,20 +540,30 @@ class NotionAgent:
             
             # Replace content if provided
             if content:
-                # First, get existing blocks and delete them
-                blocks = self.client.blocks.children.list(block_id=formatted_page_id)
-                for block in blocks.get("results", []):
-                    try:
-                        self.client.blocks.delete(block_id=block["id"])
-                    except:
-                        pass  # Some blocks can't be deleted
+                # First, collect all existing block IDs (handle pagination)
+                block_ids = []
+                cursor = None
+                while True:
+                    response = self.client.blocks.children.list(
+                        block_id=formatted_page_id,
+                        start_cursor=cursor
+                    )
+                    block_ids.extend(block["id"] for block in response.get("results", []))
+                    cursor = response.get("next_cursor")
+                    if not cursor:
+                        break
+                
+                # Deletes are independent of each other, so issue them concurrently
+                if block_ids:
+                    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                        failed = list(executor.map(self._delete_block, block_ids)).count(False)
+                    # Appending on top of leftover blocks would mix old and new content
+                    if failed:
+                        print(f"✗ Failed to update page: {failed} of {len(block_ids)} existing blocks could not be deleted; new content not added")
+                        return False
                 
                 # Add new content
-                new_blocks = self.markdown_to_notion_blocks(content)
-                self.client.blocks.children.append(
-                    block_id=formatted_page_id,
-                    children=new_blocks
-                )
+                self._append_blocks(formatted_page_id, _iter_blocks(content))
             
             print(f"✓ Updated page")
             return True
@@ -368,22 +575,19 @@ class NotionAgent:
 def load_config(config_path: str = ".config/notion_config.json") -> dict:
     """Load Notion configuration from JSON file"""
     # Resolve relative to project root (parent of src)
-    if not Path(config_path).is_absolute():
-        project_root = Path(__file__).resolve().parent.parent
-        config_file = project_root / config_path
-    else:
-        config_file = Path(config_path)
+    config_file = Path(config_path)
+    if not config_file.is_absolute():
+        config_file = _PROJECT_ROOT / config_file
     
-    if config_file.exists():
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {}
+    try:
+        return _json_loads(config_file.read_bytes())
+    except FileNotFoundError:
+        return {}
 
 
 def save_config(config: dict, config_path: str = ".config/notion_config.json"):
     """Save Notion configuration to JSON file"""
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    Path(config_path).write_bytes(_json_dumps(config))
     print(f"✓ Configuration saved to {config_path}")
 
 
@@ -9,19 +9,235 @@ import os
 import sys
 import json
 import re
+import asyncio
+import functools
+import types
 from typing import Optional, Dict, List
 from pathlib import Path
 
 try:
     import requests
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
+    Retry = None
+
+# orjson is optional; when present it encodes request bodies (which carry the
+# whole product description / RAG context) and decodes API responses
+try:
+    import orjson
+    
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+    
+    def _json_loads(data: bytes):
+        return json.loads(data)
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Statuses retried by the shared session. Only an explicit rate-limit
+# rejection is safe to re-send: a 5xx or a read timeout may come after the
+# generation already ran (and was billed) upstream
+_RETRY_STATUSES = (429,)
+
+# Completion bodies are streamed off the socket in chunks of this size
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+
+def _read_json_response(response) -> dict:
+    """
+    Decode a JSON response opened with stream=True.
+    
+    The body is drained into one growing bytearray as it arrives (reasoning
+    models can return large bodies) and decoded in place, instead of being
+    collected as a list of chunks and joined into a second copy.
+    """
+    body = bytearray()
+    for chunk in response.iter_content(RESPONSE_CHUNK_SIZE):
+        body.extend(chunk)
+    return _json_loads(body)
+
+
+# Patterns used by the extraction/cleaning helpers, compiled once at import
+# instead of being looked up in re's cache on every call
+
+# Post markers, in priority order (matching is case-insensitive)
+_MARKER_PATTERN_SOURCES = (
+    # Multi-line format: <POST_START>\ncontent\n<POST_END>
+    r'<POST_START>\s*\n(?P<ml>.*?)\n\s*<POST_END>',
+    # Single-line format: <POST_START>content<POST_END>
+    r'<POST_START>(?P<sl>.*?)<POST_END>',
+    # Legacy format: =========================\ncontent\n=========================
+    r'={10,}\s*\n(?P<legacy>.*?)\n\s*={10,}',
+)
+_MARKER_PATTERNS = [re.compile(p, re.DOTALL | re.IGNORECASE) for p in _MARKER_PATTERN_SOURCES]
+# All marker formats in one alternation, so the common case is a single scan
+_MARKER_RE = re.compile('|'.join(_MARKER_PATTERN_SOURCES), re.DOTALL | re.IGNORECASE)
+# Whole-line marker tags, compared against the upper-cased stripped line
+_MARKER_TAG_LINES = frozenset({'<POST_START>', '<POST_END>'})
+_INLINE_TAG_RE = re.compile(r'<POST_(START|END)>', re.IGNORECASE)
+_EQ_DECOR_RE = re.compile(r'^={3,}\s+|\s+={3,}$')
+_EQ_BLOCK_RE = re.compile(r'\n\s*={10,}\s*\n')
+
+# Phrases after which a reasoning model's final post usually starts
+_REASONING_HEADERS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Here'?s the (?:post|social media post)[:])",
+        r"(?:Generated (?:post|social media post)[:])",
+        r"(?:Post[:])",
+        r"(?:Social media post[:])",
+        r"(?:The (?:post|social media post) (?:is|would be)[:])",
+    )
+]
+_REASONING_PROMPT_LINE_RE = re.compile(
+    r'^(?:Product Description|Requirements|Platform|Tone|Based on).*?(\n|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+# Paragraphs starting with these (lower-case) are prompt echo or reasoning
+_REASONING_SKIP_PREFIXES = (
+    'product description',
+    'requirements',
+    'platform',
+    'tone',
+    'based on',
+    'i will',
+    'i need',
+    'i should',
+    'i can',
+)
+_REASONING_SKIP_LEN = max(len(prefix) for prefix in _REASONING_SKIP_PREFIXES)
+
+# Lines of the prompt echoed back into the generated content (lower-case
+# prefixes; str.startswith takes the whole tuple in one C-level call)
+_PROMPT_PREFIXES = (
+    'product description',
+    'requirements',
+    'platform',
+    'tone',
+    'maximum length',
+    'based on the following',
+    'generate the social media post',
+)
+_PROMPT_PREFIX_LEN = max(len(prefix) for prefix in _PROMPT_PREFIXES)
+
+# Reply generation: HTML tags in Mastodon statuses, ```json fences around replies
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_JSON_FENCE_RE = re.compile(r'```json\s*|\s*```')
+
+def _find_marked_block(content: str) -> Optional[str]:
+    """
+    Find a well-formed multi-line <POST_START>/<POST_END> block with str.find.
+    
+    Returns the stripped text between the first start tag and the next end
+    tag when both tags sit on their own lines around non-empty text: exactly
+    what the multi-line marker pattern extracts. Returns None whenever that
+    cannot be decided this way, and the caller falls back to the regexes.
+    """
+    folded = content.lower()
+    # Offsets in the lower-cased copy must line up with content, and 'ſ' is
+    # the one character re.IGNORECASE matches to an ASCII tag letter ('s')
+    # that lower() does not map
+    if len(folded) != len(content) or 'ſ' in content:
+        return None
+    start = folded.find('<post_start>')
+    if start < 0:
+        return None
+    start += len('<post_start>')
+    end = folded.find('<post_end>', start)
+    if end < 0:
+        return None
+    inner = content[start:end]
+    extracted = inner.strip()
+    if not extracted:
+        return None
+    # The tags must be separated from the text by whitespace containing a newline
+    head = inner[:len(inner) - len(inner.lstrip())]
+    tail = inner[len(inner.rstrip()):]
+    if '\n' not in head or '\n' not in tail:
+        return None
+    return extracted
+
+
+def _iter_paragraph_spans_reversed(text: str):
+    """
+    Yield (start, end) offsets of the paragraphs of text from last to first.
+    
+    Paragraphs are separated by a run of two or more newlines, or by a single
+    newline followed by a capitalised word (upper-case then lower-case ASCII
+    letter). Scans right to left with str.rfind, so the caller can stop at
+    the first acceptable paragraph without splitting the whole text, and
+    only slices the paragraphs it actually inspects.
+    """
+    end = len(text)
+    pos = end
+    while True:
+        nl = text.rfind('\n', 0, pos)
+        if nl < 0:
+            yield 0, end
+            return
+        # Walk back to the start of this run of newlines
+        start = nl
+        while start > 0 and text[start - 1] == '\n':
+            start -= 1
+        if nl > start or ('A' <= text[nl + 1:nl + 2] <= 'Z' and 'a' <= text[nl + 2:nl + 3] <= 'z'):
+            yield nl + 1, end
+            end = start
+        pos = start
+
+
+# Post prompt = head + product description + "\n" + RAG block + requirements
+_PROMPT_HEAD = "Based on the following product description, generate a social media post.\n\nProduct Description:\n"
+
+
+# Platform-specific prompts, keyed by lower-case platform name
+_PLATFORM_PROMPTS = {
+    "twitter": "Write a Twitter/X post (max 280 characters, engaging and concise)",
+    "linkedin": "Write a LinkedIn post (professional, longer-form, engaging)",
+    "instagram": "Write an Instagram caption (visual-friendly, engaging, use emojis sparingly)",
+    "facebook": "Write a Facebook post (friendly, engaging, conversational)",
+    "mastodon": "Write a Mastodon post (similar to Twitter but up to 500 characters, engaging and community-focused)",
+    "general": "Write a social media post (engaging and well-structured)"
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_requirements(platform_key: str, tone: str, max_length: Optional[int]) -> str:
+    """Build the constant tail of the post prompt once per (platform, tone, max_length)."""
+    platform_prompt = _PLATFORM_PROMPTS.get(platform_key, _PLATFORM_PROMPTS["general"])
+    
+    return f"""
+
+Requirements:
+- Platform: {platform_prompt}
+- Tone: {tone}
+{f"- Maximum length: {max_length} characters" if max_length else ""}
+- Make it engaging and compelling
+- Include a clear call-to-action
+- Use appropriate formatting (hashtags for Twitter/Instagram, but not LinkedIn)
+- Keep it authentic and natural
+
+IMPORTANT: Place your generated post content between XML-style tags, like this:
+
+<POST_START>
+[Your post content here]
+<POST_END>
+
+Generate the social media post:"""
 
 
 class OpenRouterClient:
     """Client for interacting with OpenRouter API"""
     
     BASE_URL = "https://openrouter.ai/api/v1"
+    CHAT_URL = BASE_URL + "/chat/completions"
+    MODELS_URL = BASE_URL + "/models"
     
     # Platform-specific character limits
     PLATFORM_LIMITS = {
@@ -49,12 +265,40 @@ class OpenRouterClient:
         
         self.api_key = api_key
         self.model = model
-        self.headers = {
+        # Read-only: the session copies these once, so later edits would be lost
+        self.headers = types.MappingProxyType({
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/dailytoparxiv/post_generation",
             "X-Title": "Post Generation Tool"
-        }
+        })
+        self.session = self._build_session()
+    
+    def _build_session(self) -> "requests.Session":
+        """
+        Build a keep-alive session carrying the auth headers.
+        
+        Posts for several platforms are generated back to back against the
+        same host, so pooling turns one TLS handshake per request into one per
+        client. Connection failures and 429s (honouring Retry-After) are retried
+        with backoff; reads are never retried, so a completion is not requested
+        twice. raise_on_status is off so the final error response still
+        reaches the caller's reporting.
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
     
     def _extract_post_from_markers(self, content: str) -> Optional[str]:
         """
@@ -74,28 +318,34 @@ class OpenRouterClient:
         if not content:
             return None
         
+        # Every marker format needs "<post_start>" (any case) or a run of ten
+        # '='; two substring tests rule that out far faster than the regex
+        has_markers = '==========' in content or '<post_start>' in content.casefold()
+        
+        # Common case: one well-formed multi-line block, located without regex
+        extracted = _find_marked_block(content) if has_markers else None
+        if extracted:
+            return self._remove_marker_artifacts(extracted)
+        
         # Primary method: XML-style tags (<POST_START> and <POST_END>)
-        # Handle both single-line and multi-line formats
-        patterns = [
-            # Multi-line format: <POST_START>\ncontent\n<POST_END>
-            r'<POST_START>\s*\n(.*?)\n\s*<POST_END>',
-            # Single-line format: <POST_START>content<POST_END>
-            r'<POST_START>(.*?)<POST_END>',
-            # Case-insensitive variants
-            r'<post_start>\s*\n(.*?)\n\s*<post_end>',
-            r'<post_start>(.*?)<post_end>',
-            # Legacy format: =========================\ncontent\n=========================
-            r'={10,}\s*\n(.*?)\n\s*={10,}',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                extracted = match.group(1).strip()
-                if extracted:
-                    # Clean up any remaining marker artifacts
-                    extracted = self._remove_marker_artifacts(extracted)
-                    return extracted
+        # Handle both single-line and multi-line formats (see _MARKER_PATTERNS)
+        match = _MARKER_RE.search(content) if has_markers else None
+        if match:
+            # The leftmost match of the top-priority format is exactly what the
+            # per-format search would find; anything else (rare: no multi-line
+            # block, or an empty one) falls back to trying the formats in order
+            extracted = match.group('ml')
+            extracted = extracted.strip() if extracted is not None else ""
+            if not extracted:
+                for pattern in _MARKER_PATTERNS:
+                    match = pattern.search(content)
+                    if match:
+                        extracted = match.group(1).strip()
+                        if extracted:
+                            break
+            if extracted:
+                # Clean up any remaining marker artifacts
+                return self._remove_marker_artifacts(extracted)
         
         # Fallback: Try to remove any marker lines that might be present
         # This handles cases where markers are mixed with content
@@ -118,28 +368,35 @@ class OpenRouterClient:
         if not content:
             return ""
         
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
-            # Skip XML-style marker tags
-            if re.match(r'^<POST_(START|END)>$', stripped, re.IGNORECASE):
-                continue
-            # Skip lines that are just equal signs (legacy markers)
-            if re.match(r'^={10,}$', stripped):
-                continue
-            # Remove marker tags if they appear inline with content
-            line = re.sub(r'<POST_(START|END)>', '', line, flags=re.IGNORECASE)
-            # Remove trailing/leading equal signs that might be decorative
-            line = re.sub(r'^={3,}\s+|\s+={3,}$', '', line)
-            cleaned_lines.append(line)
-        
-        cleaned = '\n'.join(cleaned_lines).strip()
-        
-        # Remove any remaining marker patterns from the entire content
-        cleaned = re.sub(r'<POST_(START|END)>', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\n\s*={10,}\s*\n', '\n', cleaned)
+        def _iter_lines(lines):
+            for line in lines:
+                stripped = line.strip()
+                # Most lines hold neither '<' nor '=', skip every regex below
+                # and are yielded as the original string object
+                first = stripped[:1]
+                # Skip XML-style marker tags
+                if first == '<' and stripped.upper() in _MARKER_TAG_LINES:
+                    continue
+                # Skip lines that are just equal signs (legacy markers)
+                if first == '=' and len(stripped) >= 10 and stripped.count('=') == len(stripped):
+                    continue
+                # Remove marker tags if they appear inline with content
+                if '<' in line:
+                    line = _INLINE_TAG_RE.sub('', line)
+                # Remove trailing/leading equal signs that might be decorative
+                if '=' in line:
+                    line = _EQ_DECOR_RE.sub('', line)
+                yield line
+        
+        cleaned = '\n'.join(_iter_lines(content.split('\n'))).strip()
+        
+        # Remove any remaining marker patterns from the entire content; the
+        # line pass usually leaves nothing for them to match, so only run the
+        # regexes when the characters they need are still present
+        if '<' in cleaned:
+            cleaned = _INLINE_TAG_RE.sub('', cleaned)
+        if '==========' in cleaned:
+            cleaned = _EQ_BLOCK_RE.sub('\n', cleaned)
         
         return cleaned
     
@@ -163,38 +420,23 @@ class OpenRouterClient:
             return marked_content
         
         # Try to find patterns that indicate where the actual post starts
-        patterns = [
-            r"(?:Here'?s the (?:post|social media post)[:])",
-            r"(?:Generated (?:post|social media post)[:])",
-            r"(?:Post[:])",
-            r"(?:Social media post[:])",
-            r"(?:The (?:post|social media post) (?:is|would be)[:])",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, reasoning, re.IGNORECASE)
+        for pattern in _REASONING_HEADERS:
+            match = pattern.search(reasoning)
             if match:
                 extracted = reasoning[match.end():].strip()
                 # Remove any remaining prompt-like text
-                extracted = re.sub(
-                    r'^(?:Product Description|Requirements|Platform|Tone|Based on).*?(\n|$)',
-                    '',
-                    extracted,
-                    flags=re.IGNORECASE | re.MULTILINE
-                )
+                extracted = _REASONING_PROMPT_LINE_RE.sub('', extracted)
                 if extracted:
                     return extracted
         
         # If no pattern found, try to find the last substantial paragraph
-        parts = re.split(r'\n\n+|\n(?=[A-Z][a-z])', reasoning)
-        for part in reversed(parts):
-            part = part.strip()
+        for start, end in _iter_paragraph_spans_reversed(reasoning):
+            # Stripping only shortens a paragraph: spans this short never qualify
+            if end - start <= 50:
+                continue
+            part = reasoning[start:end].strip()
             # Skip if it looks like part of the prompt or reasoning
-            if part and not re.search(
-                r'^(Product Description|Requirements|Platform|Tone|Based on|I (?:will|need|should|can))',
-                part,
-                re.IGNORECASE
-            ):
+            if part and not part[:_REASONING_SKIP_LEN].lower().startswith(_REASONING_SKIP_PREFIXES):
                 # Check if it looks like actual post content
                 if 50 < len(part) < 2000:
                     return part
@@ -221,38 +463,33 @@ class OpenRouterClient:
         for line in lines:
             line = line.strip()
             # Skip lines that look like prompt parts
-            if not re.search(
-                r'^(Product Description|Requirements|Platform|Tone|Maximum length|Based on the following|Generate the social media post)',
-                line,
-                re.IGNORECASE
-            ):
+            # Only the start of the line can match, so only it is lower-cased
+            if not line[:_PROMPT_PREFIX_LEN].lower().startswith(_PROMPT_PREFIXES):
                 cleaned_lines.append(line)
         
         return '\n'.join(cleaned_lines).strip()
     
-    def _enforce_length_limit(self, content: str, platform: str) -> str:
+    def _enforce_length_limit(self, content: str, platform_key: str) -> str:
         """
         Enforce platform-specific length limits.
         
         Args:
             content: Content to limit
-            platform: Platform name
+            platform_key: Lower-cased platform name
             
         Returns:
             Content truncated to platform limit if necessary
         """
-        platform_key = platform.lower()
         max_len = self.PLATFORM_LIMITS.get(platform_key)
         
-        if max_len and len(content) > max_len:
-            # Truncate at word boundary
-            truncated = content[:max_len].rsplit(' ', 1)[0]
-            # Add ellipsis only if we actually truncated
-            if len(content) > len(truncated):
-                return truncated + '...'
-            return truncated
+        if not max_len or len(content) <= max_len:
+            return content
         
-        return content
+        # Truncate at the last word boundary inside the limit (one scan, one slice)
+        cut = content.rfind(' ', 0, max_len)
+        if cut < 0:
+            cut = max_len
+        return content[:cut] + '...'
     
     def generate_post(
         self,
@@ -279,17 +516,8 @@ class OpenRouterClient:
             print(f"✗ Error: product_description is empty or None for {platform}")
             return None
         
-        # Build platform-specific prompts
-        platform_prompts = {
-            "twitter": "Write a Twitter/X post (max 280 characters, engaging and concise)",
-            "linkedin": "Write a LinkedIn post (professional, longer-form, engaging)",
-            "instagram": "Write an Instagram caption (visual-friendly, engaging, use emojis sparingly)",
-            "facebook": "Write a Facebook post (friendly, engaging, conversational)",
-            "mastodon": "Write a Mastodon post (similar to Twitter but up to 500 characters, engaging and community-focused)",
-            "general": "Write a social media post (engaging and well-structured)"
-        }
-        
-        platform_prompt = platform_prompts.get(platform.lower(), platform_prompts["general"])
+        # Lower-case once; messages keep the caller's spelling
+        platform_key = platform.lower()
         
         # Build the full prompt
         rag_block = ""
@@ -305,28 +533,11 @@ Grounding rules for Reference Context:
 - Prefer citing the arXiv ID/filename when referencing a paper (e.g., "2501.02730").
 """
 
-        prompt = f"""Based on the following product description, generate a social media post.
-
-Product Description:
-{product_description}
-{rag_block}
-
-Requirements:
-- Platform: {platform_prompt}
-- Tone: {tone}
-{f"- Maximum length: {max_length} characters" if max_length else ""}
-- Make it engaging and compelling
-- Include a clear call-to-action
-- Use appropriate formatting (hashtags for Twitter/Instagram, but not LinkedIn)
-- Keep it authentic and natural
-
-IMPORTANT: Place your generated post content between XML-style tags, like this:
-
-<POST_START>
-[Your post content here]
-<POST_END>
-
-Generate the social media post:"""
+        # Only the description and RAG block vary per call; the rest is cached
+        prompt = (
+            _PROMPT_HEAD + product_description + "\n" + rag_block
+            + _prompt_requirements(platform_key, tone, max_length)
+        )
 
         request_data = {
             "model": self.model,
@@ -346,23 +557,23 @@ Generate the social media post:"""
         }
         
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers=self.headers,
-                json=request_data,
-                timeout=30
-            )
-            
-            if response.status_code >= 400:
-                print(f"✗ API returned error status {response.status_code}")
-                try:
-                    error_body = response.json()
-                    print(f"  Error details: {error_body}")
-                except:
-                    print(f"  Response text: {response.text[:200]}")
-            
-            response.raise_for_status()
-            result = response.json()
+            with self.session.post(
+                self.CHAT_URL,
+                data=_json_dumps(request_data),
+                timeout=30,
+                stream=True
+            ) as response:
+                # Platforms may be generated concurrently: name the platform on
+                # every line, and print each report in one call so it stays together
+                if response.status_code >= 400:
+                    try:
+                        detail = f"Error details: {response.json()}"
+                    except:
+                        detail = f"Response text: {response.text[:200]}"
+                    print(f"✗ API returned error status {response.status_code} for {platform}\n  [{platform}] {detail}")
+                
+                response.raise_for_status()
+                result = _read_json_response(response)
             
             # Extract the generated text
             if "choices" in result and len(result["choices"]) > 0:
@@ -395,7 +606,7 @@ Generate the social media post:"""
                     content = self._remove_marker_artifacts(content)
                 
                 # Enforce length limit
-                content = self._enforce_length_limit(content, platform)
+                content = self._enforce_length_limit(content, platform_key)
                 
                 if not content:
                     print(f"✗ Content became empty after cleaning for {platform}")
@@ -403,26 +614,82 @@ Generate the social media post:"""
                 
                 return content
             else:
-                print(f"✗ Unexpected response format: {result}")
+                print(f"✗ Unexpected response format for {platform}: {result}")
                 return None
                 
         except requests.exceptions.RequestException as e:
-            print(f"✗ Failed to generate post for {platform}: {e}")
+            report = [f"✗ Failed to generate post for {platform}: {e}"]
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_detail = e.response.json()
-                    print(f"  Error details: {error_detail}")
+                    report.append(f"  [{platform}] Error details: {error_detail}")
                 except:
-                    print(f"  Status code: {e.response.status_code}")
+                    report.append(f"  [{platform}] Status code: {e.response.status_code}")
                     if hasattr(e.response, 'text'):
-                        print(f"  Response text: {e.response.text[:200]}")
+                        report.append(f"  [{platform}] Response text: {e.response.text[:200]}")
+            print("\n".join(report))
             return None
         except Exception as e:
-            print(f"✗ Unexpected error generating post for {platform}: {type(e).__name__}: {e}")
             import traceback
-            print(f"  Traceback:\n{traceback.format_exc()}")
+            print(
+                f"✗ Unexpected error generating post for {platform}: {type(e).__name__}: {e}\n"
+                f"  [{platform}] Traceback:\n{traceback.format_exc()}"
+            )
             return None
     
+    async def generate_posts_async(
+        self,
+        product_description: str,
+        platforms: List[str],
+        tone: str = "engaging",
+        max_length: Optional[int] = None,
+        rag_context: Optional[str] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Generate posts for several platforms concurrently
+        
+        Each platform is a separate, independent completion request, so they
+        are issued side by side (worker threads sharing the pooled session)
+        instead of one after another: wall time is the slowest request rather
+        than the sum.
+        
+        Args:
+            product_description: The product description to base the posts on
+            platforms: Target platforms (twitter, linkedin, instagram, etc.)
+            tone: Post tone (engaging, professional, casual, etc.)
+            max_length: Maximum length in characters (optional)
+            rag_context: Optional retrieved context (RAG) to ground claims
+        
+        Returns:
+            Dictionary mapping each platform to its post, or None if generation failed
+        """
+        loop = asyncio.get_running_loop()
+        outputs = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        self.generate_post,
+                        product_description,
+                        platform=platform,
+                        tone=tone,
+                        max_length=max_length,
+                        rag_context=rag_context,
+                    )
+                )
+                for platform in platforms
+            ],
+            return_exceptions=True
+        )
+        
+        posts = {}
+        for platform, output in zip(platforms, outputs):
+            if isinstance(output, Exception):
+                print(f"✗ Unexpected error generating post for {platform}: {type(output).__name__}: {output}")
+                output = None
+            posts[platform] = output
+        return posts
+    
     def verify_credentials(self) -> bool:
         """
         Verify that API credentials are valid
@@ -431,9 +698,8 @@ Generate the social media post:"""
             True if credentials are valid
         """
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/models",
-                headers=self.headers,
+            response = self.session.get(
+                self.MODELS_URL,
                 timeout=10
             )
             response.raise_for_status()
@@ -480,8 +746,7 @@ Generate the social media post:"""
             username = account.get('username', 'unknown') if isinstance(account, dict) else 'unknown'
             
             # Clean HTML tags from content (Mastodon returns HTML)
-            import re
-            post_content_clean = re.sub(r'<[^>]+>', '', post_content)
+            post_content_clean = _HTML_TAG_RE.sub('', post_content)
             post_content_clean = post_content_clean.strip()
             
             posts_text += f"\nPost {i} (ID: {post_id}, by @{username}):\n{post_content_clean}\n"
@@ -530,23 +795,22 @@ IMPORTANT: Wrap your JSON response between these tags:
                 "response_format": {"type": "json_object"}  # Request structured JSON output
             }
             
-            response = requests.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers=self.headers,
-                json=request_data,
-                timeout=60
-            )
-            
-            if response.status_code >= 400:
-                print(f"✗ API returned error status {response.status_code}")
-                try:
-                    error_body = response.json()
-                    print(f"  Error details: {error_body}")
-                except:
-                    print(f"  Response text: {response.text[:200]}")
-            
-            response.raise_for_status()
-            result = response.json()
+            with self.session.post(
+                self.CHAT_URL,
+                data=_json_dumps(request_data),
+                timeout=60,
+                stream=True
+            ) as response:
+                if response.status_code >= 400:
+                    print(f"✗ API returned error status {response.status_code}")
+                    try:
+                        error_body = response.json()
+                        print(f"  Error details: {error_body}")
+                    except:
+                        print(f"  Response text: {response.text[:200]}")
+                
+                response.raise_for_status()
+                result = _read_json_response(response)
             
             # Extract the generated JSON
             if "choices" in result and len(result["choices"]) > 0:
@@ -561,7 +825,7 @@ IMPORTANT: Wrap your JSON response between these tags:
                 # Parse JSON
                 try:
                     # Remove markdown code blocks if present
-                    content = re.sub(r'```json\s*|\s*```', '', content).strip()
+                    content = _JSON_FENCE_RE.sub('', content).strip()
                     replies_data = json.loads(content)
                     
                     replies_list = replies_data.get('replies', [])
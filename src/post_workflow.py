@@ -109,11 +109,11 @@ except ImportError:
 
 # Optional import for image generation
 try:
-    from generate_figure import generate_image, load_config as load_replicate_config
+    from generate_figure import generate_images_batch, load_config as load_replicate_config
     IMAGE_GEN_AVAILABLE = True
 except ImportError:
     IMAGE_GEN_AVAILABLE = False
-    generate_image = None
+    generate_images_batch = None
     load_replicate_config = None
 
 # Optional import for local RAG context
@@ -380,14 +380,19 @@ class PostWorkflow:
         
         generated_posts = {}
         
+        # Platforms are independent requests; generate them all at once
+        print(f"\n   Generating {len(platforms)} posts concurrently...")
         for platform in platforms:
-            print(f"\n   Generating {platform} post...")
-            post = self.openrouter_client.generate_post(
-                product_description=product_description,
-                platform=platform,
-                tone=tone,
-                rag_context=rag_context,
-            )
+            print(f"   Generating {platform} post...")
+        platform_posts = asyncio.run(self.openrouter_client.generate_posts_async(
+            product_description=product_description,
+            platforms=platforms,
+            tone=tone,
+            rag_context=rag_context,
+        ))
+        
+        for platform in platforms:
+            post = platform_posts.get(platform)
             
             if post:
                 generated_posts[platform] = post
@@ -531,6 +536,9 @@ class PostWorkflow:
             if load_replicate_config:
                 replicate_config = load_replicate_config()
             
+            # Collect prompts so all images are generated in one concurrent batch
+            image_platforms = []
+            image_prompts = []
             for platform in platforms:
                 if platform not in approved_posts:
                     continue
@@ -541,39 +549,46 @@ class PostWorkflow:
                 if not post_content:
                     continue
                 
+                image_platforms.append(platform)
+                # Use post content as prompt for image generation
+                image_prompts.append(post_content)
+            
+            image_results = []
+            if image_prompts:
+                print(f"\n   Generating images for {', '.join(image_platforms)} post(s)...")
+                print(f"   Using post content as prompt...")
                 try:
-                    print(f"\n   Generating image for {platform} post...")
-                    print(f"   Using post content as prompt...")
-                    
-                    # Use post content as prompt for image generation
-                    image_result = generate_image(
-                        prompt=post_content,
+                    image_results = generate_images_batch(
+                        prompts=image_prompts,
                         config=replicate_config,
                         download=True
                     )
-                    
-                    if 'file_path' in image_result:
-                        # Update approved_posts with image path
-                        if isinstance(approved_posts[platform], dict):
-                            approved_posts[platform]['image_path'] = image_result['file_path']
-                        else:
-                            # Convert to dict structure
-                            approved_posts[platform] = {
-                                'content': approved_posts[platform],
-                                'image_path': image_result['file_path']
-                            }
-                        print(f"✓ Generated and saved image: {image_result['file_path']}")
-                    else:
-                        print(f"⚠ Image generation completed but file not downloaded")
-                        print(f"   Image URL: {image_result.get('url', 'N/A')}")
                 except Exception as e:
-                    print(f"✗ Failed to generate image for {platform}: {e}")
+                    image_results = [{"error": str(e)} for _ in image_prompts]
+            
+            for platform, image_result in zip(image_platforms, image_results):
+                if 'error' in image_result:
+                    print(f"✗ Failed to generate image for {platform}: {image_result['error']}")
                     # Continue without image
                     if not isinstance(approved_posts[platform], dict):
                         approved_posts[platform] = {
                             'content': approved_posts[platform],
                             'image_path': None
                         }
+                elif 'file_path' in image_result:
+                    # Update approved_posts with image path
+                    if isinstance(approved_posts[platform], dict):
+                        approved_posts[platform]['image_path'] = image_result['file_path']
+                    else:
+                        # Convert to dict structure
+                        approved_posts[platform] = {
+                            'content': approved_posts[platform],
+                            'image_path': image_result['file_path']
+                        }
+                    print(f"✓ Generated and saved image: {image_result['file_path']}")
+                else:
+                    print(f"⚠ Image generation completed but file not downloaded")
+                    print(f"   Image URL: {image_result.get('url', 'N/A')}")
         
         # Step 3: Publish to Mastodon (only if "mastodon" is in platforms)
         published_posts = {}